@@ -1,6 +1,7 @@
 # backend/src/api/cards.py
 
 from fastapi import APIRouter, Depends, Response
+from pydantic import TypeAdapter
 from typing import List
 import logging
 
@@ -11,16 +12,19 @@ from ..utils.dependencies import get_card_service
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Built once at import; serializes a whole card list to JSON in one pass
+_CARD_LIST_ADAPTER = TypeAdapter(List[Card])
+
 
 @router.get("/cards", response_model=List[Card])
-async def get_all_cards(
-    response: Response,
-    card_service: CardService = Depends(get_card_service)
-):
+async def get_all_cards(card_service: CardService = Depends(get_card_service)):
     """
     Fetch all Clash Royale cards from the database.
 
     Returns cards with appropriate cache headers since card data rarely changes.
+    The Card list from the service is dumped straight to JSON with a prebuilt
+    adapter. response_model only documents the response in the OpenAPI schema;
+    FastAPI does not filter or validate the returned Response against it.
     """
     logger.info("Fetching cards from database")
     cards = await card_service.get_all_cards()
@@ -28,10 +32,13 @@ async def get_all_cards(
 
     # Add cache headers for client-side caching
     # Cards rarely change, so we can cache for 24 hours
-    response.headers["Cache-Control"] = "public, max-age=86400"  # 24 hours
-    response.headers["ETag"] = f"cards-{len(cards)}"
+    headers = {
+        "Cache-Control": "public, max-age=86400",  # 24 hours
+        "ETag": f"cards-{len(cards)}",
+    }
 
-    return cards
+    content = _CARD_LIST_ADAPTER.dump_json(cards)
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 @router.post("/cards/invalidate-cache")
@@ -1,6 +1,6 @@
 # backend/src/models/deck.py
 
-from pydantic import BaseModel, field_validator, Field, model_validator, ConfigDict
+from pydantic import BaseModel, field_validator, Field, model_validator, ConfigDict, ValidationInfo
 from typing import List, Optional
 from .card import Card
 
@@ -11,7 +11,9 @@ class Deck(BaseModel):
     user_id: Optional[str] = Field(None, description="User who owns this deck")
     cards: List[Card] = Field(..., description="List of cards in the deck")
     evolution_slots: List[Card] = Field(default_factory=list, description="Evolution card slots")
-    average_elixir: Optional[float] = Field(None, ge=0, le=10, description="Average elixir cost of the deck")
+    average_elixir: Optional[float] = Field(
+        None, ge=0, le=10, validate_default=True, description="Average elixir cost of the deck"
+    )
 
     @field_validator("name")
     @classmethod
@@ -55,37 +57,37 @@ class Deck(BaseModel):
 
     def calculate_average_elixir(self) -> float:
         """Calculate the average elixir cost of the deck including evolution slots"""
-        if not self.cards:
+        return self._average_elixir(self.cards, self.evolution_slots)
+
+    @staticmethod
+    def _average_elixir(cards: List[Card], evolution_slots: List[Card]) -> float:
+        """Average elixir cost of the given cards, counting evolution slots as extra elixir"""
+        if not cards:
             return 0.0
 
         # Calculate total elixir from main deck cards
-        total_elixir = sum(card.elixir_cost for card in self.cards)
-        total_cards = len(self.cards)
+        total_elixir = sum(card.elixir_cost for card in cards)
+        total_cards = len(cards)
 
         # Add evolution slots to the calculation
         # Evolution slots don't add to card count but do add elixir cost
-        if self.evolution_slots:
-            total_elixir += sum(card.elixir_cost for card in self.evolution_slots)
+        if evolution_slots:
+            total_elixir += sum(card.elixir_cost for card in evolution_slots)
             # Evolution slots are considered as additional elixir cost for the same cards
             # So we don't increase the card count, but we do increase total elixir
 
         return round(total_elixir / total_cards, 2) if total_cards > 0 else 0.0
 
-    @model_validator(mode="after")
-    def auto_calculate_average_elixir(self):
+    @field_validator("average_elixir", mode="before")
+    @classmethod
+    def auto_calculate_average_elixir(cls, v, info: ValidationInfo):
         """Automatically calculate average elixir if not provided"""
-        # If average_elixir is not provided or is None, calculate it
-        if self.average_elixir is None and self.cards:
-            total_elixir = sum(card.elixir_cost for card in self.cards)
-            total_cards = len(self.cards)
-
-            # Add evolution slots elixir cost
-            if self.evolution_slots:
-                total_elixir += sum(card.elixir_cost for card in self.evolution_slots)
-
-            self.average_elixir = round(total_elixir / total_cards, 2) if total_cards > 0 else 0.0
-
-        return self
+        # Filled in during field validation from the already validated cards, so
+        # the field's own ge/le bounds check the result without a second pass
+        # through validate_assignment; skipped when the cards failed validation
+        if v is None and info.data.get("cards"):
+            return cls._average_elixir(info.data["cards"], info.data.get("evolution_slots") or [])
+        return v
 
     def update_average_elixir(self) -> None:
         """Update the average elixir cost of the deck"""
@@ -10,7 +10,7 @@ import json
 import logging
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import IO, Dict, List, Tuple, Optional, Union
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -24,12 +24,12 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(level
 logger = logging.getLogger(__name__)
 
 
-def load_json_file(file_path: str) -> dict:
+def load_json_file(file_path: Union[str, Path, IO[str]]) -> dict:
     """
     Load and parse the JSON file containing card data.
 
     Args:
-        file_path: Path to the JSON file
+        file_path: Path to the JSON file, or an already open text stream
 
     Returns:
         Parsed JSON data as dictionary
@@ -39,9 +39,15 @@ def load_json_file(file_path: str) -> dict:
         json.JSONDecodeError: If the file contains invalid JSON
     """
     try:
-        logger.info(f"Loading JSON file from: {file_path}")
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if hasattr(file_path, "read"):
+            logger.info("Loading JSON data from stream")
+            data = json.load(file_path)
+        else:
+            logger.info(f"Loading JSON file from: {file_path}")
+            # Read raw bytes in one call and let json decode the UTF-8 itself,
+            # skipping the text-mode decoding layer
+            with open(file_path, "rb") as f:
+                data = json.loads(f.read())
         logger.info(f"Successfully loaded JSON file with {len(data.get('items', []))} cards")
         return data
     except FileNotFoundError:
@@ -55,6 +61,18 @@ def load_json_file(file_path: str) -> dict:
         raise
 
 
+# Card type keyed by the millions prefix of the card ID
+_TYPE_BY_ID_PREFIX = {26: "Troop", 27: "Building", 28: "Spell"}
+
+_RARITY_MAP = {
+    "common": "Common",
+    "rare": "Rare",
+    "epic": "Epic",
+    "legendary": "Legendary",
+    "champion": "Champion",
+}
+
+
 def determine_card_type(card_id: int) -> str:
     """
     Determine card type based on ID range.
@@ -70,15 +88,11 @@ def determine_card_type(card_id: int) -> str:
     Returns:
         Card type as string ('Troop', 'Building', or 'Spell')
     """
-    if 26000000 <= card_id <= 26999999:
-        return "Troop"
-    elif 27000000 <= card_id <= 27999999:
-        return "Building"
-    elif 28000000 <= card_id <= 28999999:
-        return "Spell"
-    else:
+    card_type = _TYPE_BY_ID_PREFIX.get(card_id // 1_000_000)
+    if card_type is None:
         logger.warning(f"Card ID {card_id} doesn't match known ranges, defaulting to 'Troop'")
         return "Troop"
+    return card_type
 
 
 def transform_card_data(card_json: dict) -> Optional[dict]:
@@ -108,49 +122,35 @@ def transform_card_data(card_json: dict) -> Optional[dict]:
         elixir_cost = card_json.get("elixirCost")
         rarity = card_json.get("rarity", "").lower()
 
-        if not all([name, elixir_cost is not None, rarity]):
+        if not name or elixir_cost is None or not rarity:
             logger.warning(f"Card {card_id} missing required fields, skipping")
             return None
 
-        # Normalize rarity to Title Case
-        rarity_map = {
-            "common": "Common",
-            "rare": "Rare",
-            "epic": "Epic",
-            "legendary": "Legendary",
-            "champion": "Champion",
-        }
-        rarity_normalized = rarity_map.get(rarity, rarity.title())
-
-        # Determine card type from ID
-        card_type = determine_card_type(card_id)
-
         # Extract image URLs
         icon_urls = card_json.get("iconUrls", {})
         image_url = icon_urls.get("medium")
-        image_url_evo = icon_urls.get("evolutionMedium")
 
         if not image_url:
             logger.warning(f"Card {card_id} ({name}) missing image URL, skipping")
             return None
 
         # Extract arena (optional)
-        arena = None
-        if "arena" in card_json and card_json["arena"]:
-            if isinstance(card_json["arena"], dict):
-                arena = card_json["arena"].get("name")
-            else:
-                arena = str(card_json["arena"])
+        arena = card_json.get("arena")
+        if arena:
+            arena = arena.get("name") if isinstance(arena, dict) else str(arena)
+        else:
+            arena = None
 
         return {
             "id": card_id,
             "name": name,
             "elixir_cost": elixir_cost,
-            "rarity": rarity_normalized,
-            "type": card_type,
+            # Normalize rarity to Title Case
+            "rarity": _RARITY_MAP.get(rarity) or rarity.title(),
+            "type": determine_card_type(card_id),
             "arena": arena,
             "image_url": image_url,
-            "image_url_evo": image_url_evo,
+            "image_url_evo": icon_urls.get("evolutionMedium"),
         }
 
     except Exception as e:
@@ -158,12 +158,74 @@ def transform_card_data(card_json: dict) -> Optional[dict]:
         return None
 
 
+def transform_cards(cards_json: List[dict]) -> List[dict]:
+    """
+    Transform a list of JSON cards in one pass, dropping invalid ones.
+
+    Args:
+        cards_json: Card data items from the JSON file
+
+    Returns:
+        Transformed cards in input order, without the ones that failed validation
+    """
+    return [card for card in map(transform_card_data, cards_json) if card]
+
+
+CARD_COLUMNS = ("id", "name", "elixir_cost", "rarity", "type", "arena", "image_url", "image_url_evo")
+
+# Rows per multi-row upsert; keeps each statement well under max_allowed_packet
+UPSERT_CHUNK_SIZE = 1000
+
+_ROW_PLACEHOLDER = "(" + ", ".join(["%s"] * len(CARD_COLUMNS)) + ")"
+
+# Upsert clause (using modern MySQL 8.0+ syntax with alias)
+_UPSERT_SUFFIX = """
+    AS new_card
+    ON DUPLICATE KEY UPDATE
+        name = new_card.name,
+        elixir_cost = new_card.elixir_cost,
+        rarity = new_card.rarity,
+        type = new_card.type,
+        arena = new_card.arena,
+        image_url = new_card.image_url,
+        image_url_evo = new_card.image_url_evo,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+def _build_insert_sql(row_count: int) -> str:
+    """Build a plain multi-row INSERT for row_count cards."""
+    return f"INSERT INTO cards ({', '.join(CARD_COLUMNS)}) VALUES " + ", ".join([_ROW_PLACEHOLDER] * row_count)
+
+
+def _build_upsert_sql(row_count: int) -> str:
+    """Build a multi-row INSERT ... ON DUPLICATE KEY UPDATE for row_count cards."""
+    return _build_insert_sql(row_count) + _UPSERT_SUFFIX
+
+
+def _existing_card_ids(cursor, card_ids: List[int]) -> set:
+    """Return which of card_ids are already present in the cards table, in one query."""
+    if not card_ids:
+        return set()
+    placeholders = ", ".join(["%s"] * len(card_ids))
+    cursor.execute(f"SELECT id FROM cards WHERE id IN ({placeholders})", card_ids)
+    return {row[0] for row in cursor.fetchall()}
+
+
 def ingest_cards(cards_data: List[dict]) -> Tuple[int, int, int]:
     """
     Insert or update cards in the database using upsert logic.
 
-    Uses INSERT ... ON DUPLICATE KEY UPDATE to handle both new cards
-    and updates to existing cards.
+    Each chunk of UPSERT_CHUNK_SIZE cards is split, with one id lookup, into
+    new and existing cards. New cards go in with a single multi-row INSERT and
+    existing ones with a single multi-row INSERT ... ON DUPLICATE KEY UPDATE,
+    so a chunk costs three round trips however many cards it holds. If a
+    statement fails, its cards are retried one at a time so only the
+    offending cards count as errors.
+
+    The whole run is one explicit transaction committed once at the end, so
+    the server flushes its redo log a single time and a failure leaves the
+    cards table untouched.
 
     Args:
         cards_data: List of transformed card dictionaries
@@ -178,23 +240,7 @@ def ingest_cards(cards_data: List[dict]) -> Tuple[int, int, int]:
     updated_count = 0
     error_count = 0
 
-    # SQL for upsert operation (using modern MySQL 8.0+ syntax with alias)
-    upsert_sql = """
-        INSERT INTO cards (
-            id, name, elixir_cost, rarity, type, arena, image_url, image_url_evo
-        ) VALUES (
-            %(id)s, %(name)s, %(elixir_cost)s, %(rarity)s, %(type)s, %(arena)s, %(image_url)s, %(image_url_evo)s
-        ) AS new_card
-        ON DUPLICATE KEY UPDATE
-            name = new_card.name,
-            elixir_cost = new_card.elixir_cost,
-            rarity = new_card.rarity,
-            type = new_card.type,
-            arena = new_card.arena,
-            image_url = new_card.image_url,
-            image_url_evo = new_card.image_url_evo,
-            updated_at = CURRENT_TIMESTAMP
-    """
+    single_upsert_sql = _build_upsert_sql(1)
 
     try:
         # Initialize database connection
@@ -204,36 +250,65 @@ def ingest_cards(cards_data: List[dict]) -> Tuple[int, int, int]:
 
         with db_manager.get_connection() as connection:
             cursor = connection.cursor()
+            retry_cursor = None
+
+            def write_cards(cards: List[dict], build_sql) -> Tuple[int, int]:
+                """Write cards in one statement, falling back to one at a time; returns (written, errors)"""
+                nonlocal retry_cursor
+                if not cards:
+                    return 0, 0
+
+                try:
+                    params = [card[column] for card in cards for column in CARD_COLUMNS]
+                    cursor.execute(build_sql(len(cards)), params)
+                    return len(cards), 0
+
+                except Exception as e:
+                    # The failed statement wrote nothing; retry card by card
+                    # through a server-side prepared statement, parsed once
+                    logger.warning(f"Batch write failed, retrying cards individually: {e}")
+                    if retry_cursor is None:
+                        retry_cursor = connection.cursor(prepared=True)
+                    written = errors = 0
+                    for card in cards:
+                        try:
+                            retry_cursor.execute(single_upsert_sql, [card[column] for column in CARD_COLUMNS])
+                            written += 1
+                        except Exception as e:
+                            errors += 1
+                            logger.error(f"Error processing card {card.get('id')} ({card.get('name')}): {e}")
+                    return written, errors
 
             try:
-                # Process cards in batches for better performance
-                batch_size = 50
-                for i in range(0, len(cards_data), batch_size):
-                    batch = cards_data[i : i + batch_size]
+                connection.start_transaction()
 
-                    for card in batch:
-                        try:
-                            # Check if card exists before insert
-                            cursor.execute("SELECT id FROM cards WHERE id = %s", (card["id"],))
-                            exists = cursor.fetchone() is not None
+                for i in range(0, len(cards_data), UPSERT_CHUNK_SIZE):
+                    chunk = cards_data[i : i + UPSERT_CHUNK_SIZE]
 
-                            # Execute upsert
-                            cursor.execute(upsert_sql, card)
+                    # One lookup splits the chunk into new and existing cards; a
+                    # repeated new id is an update of its first occurrence
+                    existing_ids = _existing_card_ids(cursor, [card["id"] for card in chunk])
+                    new_cards, existing_cards = [], []
+                    for card in chunk:
+                        if card["id"] in existing_ids:
+                            existing_cards.append(card)
+                        else:
+                            new_cards.append(card)
+                            existing_ids.add(card["id"])
 
-                            # Track whether this was an insert or update
-                            if exists:
-                                updated_count += 1
-                            else:
-                                inserted_count += 1
+                    written, errors = write_cards(new_cards, _build_insert_sql)
+                    inserted_count += written
+                    error_count += errors
 
-                        except Exception as e:
-                            error_count += 1
-                            logger.error(f"Error processing card {card.get('id')} ({card.get('name')}): {e}")
-                            continue
+                    written, errors = write_cards(existing_cards, _build_upsert_sql)
+                    updated_count += written
+                    error_count += errors
+
+                    logger.info(
+                        f"Processed batch {i//UPSERT_CHUNK_SIZE + 1} ({i + len(chunk)}/{len(cards_data)} cards)"
+                    )
 
-                    # Commit batch
-                    connection.commit()
-                    logger.info(f"Processed batch {i//batch_size + 1} ({i + len(batch)}/{len(cards_data)} cards)")
+                connection.commit()
 
                 logger.info(
                     f"Ingestion complete: {inserted_count} inserted, {updated_count} updated, {error_count} errors"
@@ -245,6 +320,8 @@ def ingest_cards(cards_data: List[dict]) -> Tuple[int, int, int]:
                 raise DatabaseError(f"Failed to ingest cards: {e}")
             finally:
                 cursor.close()
+                if retry_cursor is not None:
+                    retry_cursor.close()
 
     except DatabaseError as e:
         logger.error(f"Database error during ingestion: {e}")
@@ -284,11 +361,7 @@ def main():
 
         # Transform card data
         logger.info("Transforming card data...")
-        transformed_cards = []
-        for card_json in cards_list:
-            transformed = transform_card_data(card_json)
-            if transformed:
-                transformed_cards.append(transformed)
+        transformed_cards = transform_cards(cards_list)
 
         logger.info(f"Successfully transformed {len(transformed_cards)} cards")
 
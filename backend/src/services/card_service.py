@@ -1,13 +1,15 @@
 # backend/src/services/card_service.py
 
 import logging
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Generator, List, Optional
 from mysql.connector import Error as MySQLError
 from mysql.connector.cursor import MySQLCursor
 
 from ..models.card import Card
 from ..exceptions import DatabaseError
 from ..utils.cache import cards_cache
+from ..utils.database import get_db_session
 
 logger = logging.getLogger(__name__)
 
@@ -15,10 +17,25 @@ logger = logging.getLogger(__name__)
 class CardService:
     """Service for managing card database operations."""
 
-    def __init__(self, db_session: MySQLCursor):
-        """Initialize card service with database session dependency injection."""
+    def __init__(self, db_session: Optional[MySQLCursor] = None):
+        """
+        Initialize card service with database session dependency injection.
+
+        Without an injected session, each cache miss checks a session out of
+        the pool just for its query and returns it before the cards are
+        serialized, so cache hits never hold a pooled connection.
+        """
         self.db_session = db_session
 
+    @contextmanager
+    def _session(self) -> Generator[MySQLCursor, None, None]:
+        """Yield the injected session, or a pooled one held only for the query."""
+        if self.db_session is not None:
+            yield self.db_session
+        else:
+            with get_db_session() as session:
+                yield session
+
     async def get_all_cards(self) -> List[Card]:
         """
         Retrieve all cards from the database with caching.
@@ -40,13 +57,14 @@ class CardService:
 
         # Cache miss - fetch from database
         try:
-            self.db_session.execute(
-                """SELECT id, name, elixir_cost, rarity, type, arena,
-                          image_url, image_url_evo
-                   FROM cards
-                   ORDER BY id"""
-            )
-            rows = self.db_session.fetchall()
+            with self._session() as session:
+                session.execute(
+                    """SELECT id, name, elixir_cost, rarity, type, arena,
+                              image_url, image_url_evo
+                       FROM cards
+                       ORDER BY id"""
+                )
+                rows = session.fetchall()
 
             cards = []
             for row in rows:
@@ -93,14 +111,15 @@ class CardService:
 
         # Cache miss - fetch from database
         try:
-            self.db_session.execute(
-                """SELECT id, name, elixir_cost, rarity, type, arena,
-                          image_url, image_url_evo
-                   FROM cards
-                   WHERE id = %s""",
-                (card_id,),
-            )
-            row = self.db_session.fetchone()
+            with self._session() as session:
+                session.execute(
+                    """SELECT id, name, elixir_cost, rarity, type, arena,
+                              image_url, image_url_evo
+                       FROM cards
+                       WHERE id = %s""",
+                    (card_id,),
+                )
+                row = session.fetchone()
 
             if not row:
                 logger.debug(f"Card {card_id} not found in database")
@@ -148,20 +167,17 @@ class CardService:
             TypeError: If required fields are missing
         """
         try:
-            # Handle NULL values for optional fields
-            arena = row.get("arena") if row.get("arena") is not None else None
-            image_url_evo = row.get("image_url_evo") if row.get("image_url_evo") is not None else None
-
-            # Create Card instance with validation
+            # Create Card instance with validation; NULL optional fields
+            # come through as None
             card = Card(
                 id=row["id"],
                 name=row["name"],
                 elixir_cost=row["elixir_cost"],
                 rarity=row["rarity"],
                 type=row["type"],
-                arena=arena,
+                arena=row.get("arena"),
                 image_url=row["image_url"],
-                image_url_evo=image_url_evo,
+                image_url_evo=row.get("image_url_evo"),
             )
 
             return card
@@ -1,5 +1,6 @@
 # backend/src/utils/config.py
 
+from functools import lru_cache
 from typing import List, Optional
 from pydantic import field_validator, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,6 +17,7 @@ class Settings(BaseSettings):
     db_user: str = "clash_user"
     db_password: str = "password"
     db_root_password: Optional[str] = None
+    db_pool_size: int = 10
 
     # Legacy database URL support (will be constructed from components if not provided)
     database_url: Optional[str] = None
@@ -191,8 +193,13 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings instance."""
+    """Get application settings instance.
+
+    Settings are read from the environment and env files once and cached;
+    call get_settings.cache_clear() after changing the environment.
+    """
     return Settings()
 
 
@@ -34,12 +34,12 @@ class TransactionError(DatabaseError):
 class DatabaseManager:
     """Enhanced database connection manager with connection pooling, retry logic, and comprehensive error handling."""
 
-    def __init__(self, settings=None):
+    def __init__(self, settings=None, max_connection_attempts: int = 5):
         self.settings = settings or get_settings()
         self._pool: Optional[pooling.MySQLConnectionPool] = None
         self._initialized = False
         self._connection_attempts = 0
-        self._max_connection_attempts = 5
+        self._max_connection_attempts = max_connection_attempts
         self._retry_delay = 2  # seconds
 
     def initialize(self) -> None:
@@ -59,7 +59,10 @@ class DatabaseManager:
 
                 # Create connection pool with enhanced configuration
                 self._pool = pooling.MySQLConnectionPool(
-                    pool_name="clash_deck_builder_pool", pool_size=10, pool_reset_session=True, **db_config
+                    pool_name="clash_deck_builder_pool",
+                    pool_size=self.settings.db_pool_size,
+                    pool_reset_session=True,
+                    **db_config,
                 )
 
                 self._initialized = True
@@ -246,26 +249,30 @@ class DatabaseManager:
             with self.get_connection() as conn:
                 cursor = conn.cursor(dictionary=True)
 
-                # Test basic connectivity
-                cursor.execute("SELECT 1")
-                result = cursor.fetchone()
-
-                if result:
-                    health_status.update({"status": "healthy", "connection_test": "passed"})
-
-                # Test table existence (basic schema validation)
+                # Test connectivity and count tables (basic schema validation)
+                # in a single round trip
                 cursor.execute(
                     """
-                    SELECT COUNT(*) as table_count 
-                    FROM information_schema.tables 
-                    WHERE table_schema = %s
+                    SELECT VERSION() AS mysql_version,
+                           NOW() AS `current_time`,
+                           (SELECT COUNT(*)
+                              FROM information_schema.tables
+                             WHERE table_schema = %s) AS table_count
                 """,
                     (self.settings.db_name,),
                 )
 
-                table_result = cursor.fetchone()
-                if table_result:
-                    health_status["table_count"] = table_result[0]
+                result = cursor.fetchone()
+                if result:
+                    health_status.update(
+                        {
+                            "status": "healthy",
+                            "connection_test": "passed",
+                            "mysql_version": result["mysql_version"],
+                            "current_time": result["current_time"].isoformat(),
+                            "table_count": result["table_count"],
+                        }
+                    )
 
                 cursor.close()
 
@@ -27,9 +27,14 @@ def get_deck_service(db_session: MySQLCursor = Depends(get_database_session)) ->
     return DeckService(db_session)
 
 
-def get_card_service(db_session: MySQLCursor = Depends(get_database_session)) -> CardService:
-    """FastAPI dependency for card service with database session injection."""
-    return CardService(db_session)
+def get_card_service() -> CardService:
+    """
+    FastAPI dependency for card service.
+
+    The service checks a pooled session out only for the query on a cache
+    miss, so card requests do not hold a connection for their whole lifetime.
+    """
+    return CardService()
 
 
 # Dependency aliases for easier imports
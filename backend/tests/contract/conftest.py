@@ -0,0 +1,99 @@
+"""
+Shared fixtures for deck API contract tests
+"""
+import json
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.decks import router as decks_router
+from src.middleware.auth_middleware import require_auth
+from src.models.card import Card
+from src.models.user import User
+from src.utils.dependencies import get_deck_service
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Create FastAPI app for testing"""
+    app = FastAPI()
+    app.include_router(decks_router, prefix="/api")
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create test client, running app startup/shutdown once per session"""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def sample_cards():
+    """Sample cards for deck payloads"""
+    return [
+        Card(id=26000000, name="Knight", elixir_cost=3, rarity="Common", type="Troop",
+             image_url="https://example.com/knight.png"),
+        Card(id=26000001, name="Archers", elixir_cost=3, rarity="Common", type="Troop",
+             image_url="https://example.com/archers.png"),
+        Card(id=26000002, name="Goblins", elixir_cost=2, rarity="Common", type="Troop",
+             image_url="https://example.com/goblins.png"),
+        Card(id=26000003, name="Giant", elixir_cost=5, rarity="Rare", type="Troop",
+             image_url="https://example.com/giant.png"),
+        Card(id=26000004, name="P.E.K.K.A", elixir_cost=7, rarity="Epic", type="Troop",
+             image_url="https://example.com/pekka.png"),
+        Card(id=26000005, name="Minions", elixir_cost=3, rarity="Common", type="Troop",
+             image_url="https://example.com/minions.png"),
+        Card(id=28000000, name="Arrows", elixir_cost=3, rarity="Common", type="Spell",
+             image_url="https://example.com/arrows.png"),
+        Card(id=28000001, name="Fireball", elixir_cost=4, rarity="Rare", type="Spell",
+             image_url="https://example.com/fireball.png"),
+    ]
+
+
+@pytest.fixture(scope="session")
+def updated_deck_body(sample_cards):
+    """PUT payload for an updated 8-card deck, serialized once per session"""
+    return json.dumps({
+        "name": "Updated Deck Name",
+        "cards": [card.model_dump() for card in sample_cards],
+        "evolution_slots": [sample_cards[0].model_dump(), sample_cards[1].model_dump()],
+    }).encode()
+
+
+@pytest.fixture
+def mock_user():
+    """Mock authenticated user"""
+    return User(
+        id="test-user-123",
+        google_id="google-id-123",
+        email="test@example.com",
+        name="Test User",
+        created_at=datetime.now(),
+        updated_at=datetime.now()
+    )
+
+
+@pytest.fixture
+def override_deps(app, mock_user):
+    """Authenticate as mock_user and return a setter that installs a deck service stub"""
+    async def mock_require_auth():
+        return {
+            "user_id": mock_user.id,
+            "google_id": mock_user.google_id,
+            "email": mock_user.email,
+            "name": mock_user.name,
+        }
+
+    def install(deck_service):
+        async def mock_get_deck_service():
+            return deck_service
+
+        app.dependency_overrides[require_auth] = mock_require_auth
+        app.dependency_overrides[get_deck_service] = mock_get_deck_service
+
+    yield install
+
+    app.dependency_overrides.clear()
@@ -0,0 +1,37 @@
+# backend/tests/contract/test_decks_not_found.py
+
+import pytest
+
+from tests.fixtures.fake_services import FakeDeckService
+
+
+@pytest.mark.parametrize(
+    "verb,method,missing_result",
+    [
+        ("delete", "delete_deck", False),
+        ("get", "get_deck", None),
+        ("put", "update_deck", None),
+    ],
+)
+def test_missing_deck_returns_404(client, override_deps, updated_deck_body, verb, method, missing_result):
+    """
+    Test that DELETE, GET and PUT /api/decks/{deck_id} return 404 for a non-existent deck.
+    """
+    # Mock deck service to report the deck as missing
+    override_deps(FakeDeckService(**{method: missing_result}))
+
+    kwargs = {}
+    if verb == "put":
+        kwargs["content"] = updated_deck_body
+        kwargs["headers"] = {"content-type": "application/json"}
+
+    # Make request
+    response = getattr(client, verb)("/api/decks/999", **kwargs)
+
+    # Verify response status
+    assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+
+    # Verify error message
+    data = response.json()
+    assert "detail" in data
+    assert "not found" in data["detail"].lower()
@@ -0,0 +1,36 @@
+"""
+Lightweight service stubs for API contract tests
+"""
+from typing import Any
+
+
+class FakeDeckService:
+    """Stand-in for DeckService whose async methods return preset values"""
+
+    def __init__(self, **return_values: Any):
+        self._return_values = return_values
+
+    async def create_deck(self, *args, **kwargs):
+        return self._return_values["create_deck"]
+
+    async def get_deck(self, *args, **kwargs):
+        return self._return_values["get_deck"]
+
+    async def get_user_decks(self, *args, **kwargs):
+        return self._return_values["get_user_decks"]
+
+    async def update_deck(self, *args, **kwargs):
+        return self._return_values["update_deck"]
+
+    async def delete_deck(self, *args, **kwargs):
+        return self._return_values["delete_deck"]
+
+
+class FailingCardService:
+    """Stand-in for CardService whose get_all_cards raises the given error"""
+
+    def __init__(self, error: Exception):
+        self._error = error
+
+    async def get_all_cards(self):
+        raise self._error
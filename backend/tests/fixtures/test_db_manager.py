@@ -1,38 +1,134 @@
 """
 Test database manager for handling test database setup and cleanup
 """
+import functools
+from contextlib import contextmanager
 import mysql.connector
 from mysql.connector import Error as MySQLError
+from mysql.connector.cursor import MySQLCursorPrepared
 import logging
 import os
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import time
 
 logger = logging.getLogger(__name__)
 
+TEST_DATA_FILE = Path(__file__).parent / "test_data.sql"
+
+# Tables that get_table_count may be asked about; table names cannot be bound
+# as query parameters, so anything else is rejected
+COUNTABLE_TABLES = frozenset({"users", "decks", "cards", "cards_cache", "schema_migrations"})
+
+_SELECT_RE = re.compile(r'\s*select\b', re.IGNORECASE)
+
+_AUTO_INCREMENT_RE = re.compile(r' AUTO_INCREMENT=\d+')
+
+
+# Database created by docker-compose.test.yml; per-worker databases copy its tables
+BASE_TEST_DATABASE = "clash_deck_builder_test"
+
+
+def default_test_database() -> str:
+    """Test database name, suffixed per pytest-xdist worker so workers never share data"""
+    if "TEST_MYSQL_DATABASE" in os.environ:
+        return os.environ["TEST_MYSQL_DATABASE"]
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    return f"{BASE_TEST_DATABASE}_{worker}" if worker else BASE_TEST_DATABASE
+
+
+def _foreign_keys(cursor, schema: str) -> Set[Tuple]:
+    """Foreign key columns of a schema with their referential actions"""
+    cursor.execute(
+        "SELECT k.table_name, k.constraint_name, k.column_name, "
+        "k.referenced_table_name, k.referenced_column_name, "
+        "r.update_rule, r.delete_rule "
+        "FROM information_schema.key_column_usage k "
+        "JOIN information_schema.referential_constraints r "
+        "ON r.constraint_schema = k.constraint_schema "
+        "AND r.constraint_name = k.constraint_name "
+        "WHERE k.table_schema = %s AND k.referenced_table_name IS NOT NULL",
+        (schema,)
+    )
+    return set(cursor.fetchall())
+
+
+def _schema_signature(cursor, schema: str) -> Tuple[Optional[tuple], Dict[str, str], Dict[str, str], List[tuple]]:
+    """Charset, table DDL, trigger DDL and migration history of a schema, for comparing copies
+
+    Tables and triggers map to their SHOW CREATE text, with the table's
+    AUTO_INCREMENT counter stripped, so any change to columns, indexes,
+    constraints or table options shows up as a difference.
+    """
+    cursor.execute(
+        "SELECT default_character_set_name, default_collation_name "
+        "FROM information_schema.schemata WHERE schema_name = %s",
+        (schema,)
+    )
+    charset = cursor.fetchone()
+
+    cursor.execute(
+        "SELECT table_name FROM information_schema.tables "
+        "WHERE table_schema = %s AND table_type = 'BASE TABLE' ORDER BY table_name",
+        (schema,)
+    )
+    tables = {}
+    for (name,) in cursor.fetchall():
+        cursor.execute(f"SHOW CREATE TABLE `{schema}`.`{name}`")
+        tables[name] = _AUTO_INCREMENT_RE.sub("", cursor.fetchone()[1])
+
+    cursor.execute(
+        "SELECT trigger_name FROM information_schema.triggers "
+        "WHERE trigger_schema = %s ORDER BY event_object_table, action_timing, "
+        "event_manipulation, action_order",
+        (schema,)
+    )
+    triggers = {}
+    for (name,) in cursor.fetchall():
+        cursor.execute(f"SHOW CREATE TRIGGER `{schema}`.`{name}`")
+        triggers[name] = cursor.fetchone()[2]
+
+    migrations = []
+    if "schema_migrations" in tables:
+        cursor.execute(f"SELECT * FROM `{schema}`.schema_migrations ORDER BY 1")
+        migrations = cursor.fetchall()
+    return charset, tables, triggers, migrations
+
 
 class TestDatabaseManager:
     """Manages test database setup, seeding, and cleanup"""
+
+    # Not a test class, despite the name
+    __test__ = False
     
     def __init__(self, 
-                 host: str = "localhost",
-                 port: int = 3307,
-                 database: str = "clash_deck_builder_test",
+                 host: Optional[str] = None,
+                 port: Optional[int] = None,
+                 database: Optional[str] = None,
                  user: str = "test_user",
                  password: str = "test_password",
                  root_password: str = "test_root_password"):
-        self.host = host
-        self.port = port
-        self.database = database
+        self.host = host or os.environ.get("TEST_MYSQL_HOST", "localhost")
+        self.port = port or int(os.environ.get("TEST_MYSQL_PORT", 3307))
+        self.database = database or default_test_database()
         self.user = user
         self.password = password
         self.root_password = root_password
         self.connection: Optional[mysql.connector.MySQLConnection] = None
+        self._count_cursors: Dict[str, MySQLCursorPrepared] = {}
+        self._hold_commits = False
         
-    def wait_for_database(self, timeout: int = 60) -> bool:
-        """Wait for database to be ready"""
+    def wait_for_database(self, timeout: int = 60, database: Optional[str] = None) -> bool:
+        """Wait for database to be ready
+
+        database overrides which database to probe, e.g. the template when
+        this manager's own database has not been provisioned yet.
+        """
         start_time = time.time()
+        # Back off from 100ms up to 2s so an already-running server is found
+        # almost immediately while a cold start is not hammered
+        delay = 0.1
         while time.time() - start_time < timeout:
             try:
                 conn = mysql.connector.connect(
@@ -40,18 +136,106 @@ class TestDatabaseManager:
                     port=self.port,
                     user="root",
                     password=self.root_password,
-                    database=self.database
+                    database=database or self.database
                 )
                 conn.close()
                 logger.info("Test database is ready")
                 return True
             except MySQLError:
-                time.sleep(2)
+                time.sleep(delay)
+                delay = min(delay * 2, 2.0)
                 continue
         
         logger.error(f"Test database not ready after {timeout} seconds")
         return False
     
+    def provision_database(self, template: str = BASE_TEST_DATABASE) -> bool:
+        """Create this manager's database as an empty copy of the template's schema
+
+        Gives each pytest-xdist worker its own database on the shared test
+        server. Tables are rebuilt from the template's SHOW CREATE TABLE, so
+        foreign keys and check constraints come along, followed by its
+        triggers and schema_migrations rows. A database left by an earlier
+        run is reused only when its table and trigger DDL and its migration
+        history still match the template; otherwise it is dropped and rebuilt.
+        """
+        if self.database == template:
+            return True
+
+        try:
+            conn = mysql.connector.connect(
+                host=self.host,
+                port=self.port,
+                user="root",
+                password=self.root_password,
+                database=template
+            )
+        except MySQLError as e:
+            logger.error(f"Failed to connect to template database {template}: {e}")
+            return False
+
+        try:
+            cursor = conn.cursor()
+            expected = _schema_signature(cursor, template)
+            if _schema_signature(cursor, self.database) == expected:
+                logger.info(f"Reusing test database {self.database}")
+                return True
+
+            charset, tables, triggers, _ = expected
+            cursor.execute(f"DROP DATABASE IF EXISTS `{self.database}`")
+            cursor.execute(
+                f"CREATE DATABASE `{self.database}` "
+                f"CHARACTER SET {charset[0]} COLLATE {charset[1]}"
+            )
+
+            # The DDL names tables without a schema, so run it inside the new
+            # database; FK checks are off so tables can reference each other
+            # in any order
+            cursor.execute(f"USE `{self.database}`")
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+            for statement in [*tables.values(), *triggers.values()]:
+                cursor.execute(statement)
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+            if "schema_migrations" in tables:
+                cursor.execute(
+                    f"INSERT INTO `{self.database}`.schema_migrations "
+                    f"SELECT * FROM `{template}`.schema_migrations"
+                )
+            cursor.execute(f"GRANT ALL PRIVILEGES ON `{self.database}`.* TO '{self.user}'@'%'")
+            conn.commit()
+
+            if _schema_signature(cursor, self.database) != expected:
+                logger.error(
+                    f"Test database {self.database} does not match the schema of {template}"
+                )
+                return False
+
+            cursor.close()
+            logger.info(f"Provisioned test database {self.database} from {template}")
+            return True
+
+        except MySQLError as e:
+            logger.error(f"Failed to provision test database {self.database}: {e}")
+            return False
+        finally:
+            conn.close()
+
+    def foreign_keys(self, database: Optional[str] = None) -> Set[Tuple]:
+        """Foreign keys of a database (this manager's by default)
+
+        Each entry is (table, constraint, column, referenced table,
+        referenced column, update rule, delete rule).
+        """
+        if not self.connection or not self.connection.is_connected():
+            raise RuntimeError("Not connected to database")
+
+        cursor = self.connection.cursor()
+        try:
+            return _foreign_keys(cursor, database or self.database)
+        finally:
+            cursor.close()
+
     def connect(self) -> bool:
         """Connect to test database"""
         try:
@@ -71,10 +255,31 @@ class TestDatabaseManager:
     
     def disconnect(self):
         """Disconnect from test database"""
+        for cursor in self._count_cursors.values():
+            cursor.close()
+        self._count_cursors.clear()
+
         if self.connection and self.connection.is_connected():
             self.connection.close()
             logger.info("Disconnected from test database")
     
+    def _data_tables(self, cursor) -> List[str]:
+        """Names of every table except schema_migrations
+
+        Read on each call, since migration tests may add or drop tables
+        during the session.
+        """
+        cursor.execute(
+            "SELECT table_name FROM information_schema.tables "
+            "WHERE table_schema = %s AND table_name <> 'schema_migrations'",
+            (self.database,)
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    def _truncate_statements(self, cursor) -> str:
+        """TRUNCATE statements for every table except schema_migrations"""
+        return "".join(f"TRUNCATE TABLE {name}; " for name in self._data_tables(cursor))
+
     def clean_database(self) -> bool:
         """Clean all data from test database tables"""
         if not self.connection or not self.connection.is_connected():
@@ -83,23 +288,16 @@ class TestDatabaseManager:
         
         try:
             cursor = self.connection.cursor()
-            
-            # Disable foreign key checks temporarily
-            cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
-            
-            # Get all tables
-            cursor.execute("SHOW TABLES")
-            tables = cursor.fetchall()
-            
-            # Truncate all tables except schema_migrations
-            for (table_name,) in tables:
-                if table_name != 'schema_migrations':
-                    cursor.execute(f"TRUNCATE TABLE {table_name}")
-                    logger.debug(f"Truncated table: {table_name}")
-            
-            # Re-enable foreign key checks
-            cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
-            
+
+            # Empty all tables except schema_migrations in one batch
+            cursor.execute(
+                f"SET FOREIGN_KEY_CHECKS = 0; {self._truncate_statements(cursor)}"
+                "SET FOREIGN_KEY_CHECKS = 1"
+            )
+            while cursor.nextset():
+                pass
+            logger.debug("Cleared test database tables")
+
             self.connection.commit()
             cursor.close()
             logger.info("Test database cleaned successfully")
@@ -111,35 +309,40 @@ class TestDatabaseManager:
                 self.connection.rollback()
             return False
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_seed_script(path: str) -> str:
+        """Read the seed SQL file once and wrap it into a single batch"""
+        with open(path, 'r') as f:
+            sql_content = f.read()
+
+        return (
+            "SET UNIQUE_CHECKS = 0; SET FOREIGN_KEY_CHECKS = 0;\n"
+            f"{sql_content.rstrip().rstrip(';')};\n"
+            "SET FOREIGN_KEY_CHECKS = 1; SET UNIQUE_CHECKS = 1"
+        )
+
     def seed_test_data(self) -> bool:
         """Seed test database with test data"""
         if not self.connection or not self.connection.is_connected():
             logger.error("Not connected to database")
             return False
         
+        if not TEST_DATA_FILE.exists():
+            logger.error(f"Test data file not found: {TEST_DATA_FILE}")
+            return False
+
         try:
-            # Load test data SQL file
-            fixtures_dir = Path(__file__).parent
-            test_data_file = fixtures_dir / "test_data.sql"
-            
-            if not test_data_file.exists():
-                logger.error(f"Test data file not found: {test_data_file}")
-                return False
-            
-            with open(test_data_file, 'r') as f:
-                sql_content = f.read()
-            
-            # Split SQL statements and execute them
+            # Send the whole seed file as a single multi-statement batch
+            # (one round trip) with per-row unique/FK checks disabled
             cursor = self.connection.cursor()
-            
-            # Split by semicolon and filter out empty statements
-            statements = [stmt.strip() for stmt in sql_content.split(';') if stmt.strip()]
-            
-            for statement in statements:
-                if statement and not statement.startswith('--'):
-                    cursor.execute(statement)
-                    logger.debug(f"Executed: {statement[:50]}...")
-            
+            cursor.execute(self._load_seed_script(str(TEST_DATA_FILE)))
+
+            # Drain the remaining result sets so the connection is usable again
+            while cursor.nextset():
+                pass
+            logger.debug("Executed test data seed batch")
+
             self.connection.commit()
             cursor.close()
             logger.info("Test data seeded successfully")
@@ -151,6 +354,41 @@ class TestDatabaseManager:
                 self.connection.rollback()
             return False
     
+    def reseed(self) -> bool:
+        """Clean and seed the test database in a single round trip
+
+        Equivalent to clean_database() followed by seed_test_data(), but the
+        TRUNCATEs and the seed INSERTs go to the server as one batch with
+        foreign key checks held off throughout.
+        """
+        if not self.connection or not self.connection.is_connected():
+            logger.error("Not connected to database")
+            return False
+
+        if not TEST_DATA_FILE.exists():
+            logger.error(f"Test data file not found: {TEST_DATA_FILE}")
+            return False
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                f"SET FOREIGN_KEY_CHECKS = 0; {self._truncate_statements(cursor)}"
+                f"{self._load_seed_script(str(TEST_DATA_FILE))}"
+            )
+            while cursor.nextset():
+                pass
+
+            self.connection.commit()
+            cursor.close()
+            logger.info("Test database reseeded successfully")
+            return True
+
+        except MySQLError as e:
+            logger.error(f"Failed to reseed test database: {e}")
+            if self.connection:
+                self.connection.rollback()
+            return False
+
     def setup_test_database(self) -> bool:
         """Complete test database setup: wait, connect, clean, seed"""
         if not self.wait_for_database():
@@ -159,10 +397,7 @@ class TestDatabaseManager:
         if not self.connect():
             return False
         
-        if not self.clean_database():
-            return False
-        
-        if not self.seed_test_data():
+        if not self.reseed():
             return False
         
         logger.info("Test database setup completed successfully")
@@ -177,27 +412,124 @@ class TestDatabaseManager:
         self.disconnect()
         return success
     
-    def execute_query(self, query: str, params: tuple = None) -> list:
-        """Execute a query and return results"""
+    def execute_query(self, query: str, params: tuple = None, fetchone: bool = False):
+        """Execute a query and return results
+
+        SELECTs return a list of row dicts, or a single row dict (or None)
+        when fetchone is set. Other statements are committed (unless inside
+        transaction()) and return [].
+        """
         if not self.connection or not self.connection.is_connected():
             raise RuntimeError("Not connected to database")
-        
-        cursor = self.connection.cursor(dictionary=True)
+
+        # Only SELECTs need dict rows; writes use a plain cursor
+        is_select = _SELECT_RE.match(query) is not None
+        cursor = self.connection.cursor(dictionary=is_select)
         try:
             cursor.execute(query, params)
-            if query.strip().upper().startswith('SELECT'):
+            if is_select:
+                if fetchone:
+                    row = cursor.fetchone()
+                    # Drop any remaining rows so the connection stays usable
+                    cursor.fetchall()
+                    return row
                 return cursor.fetchall()
             else:
-                self.connection.commit()
+                if not self._hold_commits:
+                    self.connection.commit()
                 return []
         finally:
             cursor.close()
     
+    @contextmanager
+    def transaction(self) -> Iterator["TestDatabaseManager"]:
+        """Run the block in one transaction that is rolled back afterwards
+
+        Writes made through execute_query and execute_many inside the block
+        are not committed, so the test needs no cleanup of its own.
+        """
+        if not self.connection or not self.connection.is_connected():
+            raise RuntimeError("Not connected to database")
+
+        self._hold_commits = True
+        try:
+            yield self
+        finally:
+            self._hold_commits = False
+            self.connection.rollback()
+
+    def execute_many(self, query: str, rows: List[tuple]) -> int:
+        """Execute a write for every parameter row and commit once
+
+        mysql-connector rewrites an INSERT ... VALUES into a single multi-row
+        statement, so the rows go to the server in one round trip. Returns
+        the number of affected rows.
+        """
+        if not self.connection or not self.connection.is_connected():
+            raise RuntimeError("Not connected to database")
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.executemany(query, rows)
+            if not self._hold_commits:
+                self.connection.commit()
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+    def fetch_by_ids(self, table_name: str, ids: List[int],
+                     columns: Optional[List[str]] = None) -> Dict[int, dict]:
+        """Fetch rows for the given ids in one query, keyed by id
+
+        columns limits the select list (id is always included); by default
+        every column is returned.
+        """
+        if table_name not in COUNTABLE_TABLES:
+            raise ValueError(f"Unknown test table: {table_name}")
+        if not ids:
+            return {}
+
+        select_list = ", ".join(["id", *columns]) if columns else "*"
+        placeholders = ", ".join(["%s"] * len(ids))
+        rows = self.execute_query(
+            f"SELECT {select_list} FROM {table_name} WHERE id IN ({placeholders})", tuple(ids)
+        )
+        return {row["id"]: row for row in rows}
+
+    def table_checksums(self) -> Dict[str, int]:
+        """CHECKSUM TABLE of every table except schema_migrations, keyed by table name
+
+        Lets a later session tell whether the database still holds exactly
+        what a seed left behind.
+        """
+        if not self.connection or not self.connection.is_connected():
+            raise RuntimeError("Not connected to database")
+
+        cursor = self.connection.cursor()
+        try:
+            names = self._data_tables(cursor)
+            if not names:
+                return {}
+            cursor.execute("CHECKSUM TABLE " + ", ".join(f"`{name}`" for name in names))
+            # Rows come back as ('<database>.<table>', checksum)
+            return {table.split(".", 1)[1]: checksum for table, checksum in cursor.fetchall()}
+        finally:
+            cursor.close()
+
     def get_table_count(self, table_name: str) -> int:
         """Get row count for a table"""
-        result = self.execute_query(f"SELECT COUNT(*) as count FROM {table_name}")
-        return result[0]['count'] if result else 0
+        if table_name not in COUNTABLE_TABLES:
+            raise ValueError(f"Unknown test table: {table_name}")
+        if not self.connection or not self.connection.is_connected():
+            raise RuntimeError("Not connected to database")
 
+        # Keep one prepared tuple cursor per table so repeated counts skip
+        # statement parsing and per-row dict construction
+        cursor = self._count_cursors.get(table_name)
+        if cursor is None:
+            cursor = self.connection.cursor(prepared=True)
+            self._count_cursors[table_name] = cursor
 
-# Global test database manager instance
-test_db_manager = TestDatabaseManager()
\ No newline at end of file
+        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+        (count,) = cursor.fetchall()[0]
+        return count
@@ -2,15 +2,15 @@
 Integration tests for card database operations and ingestion workflow
 """
 import pytest
+import io
 import json
-import tempfile
-from pathlib import Path
+from datetime import datetime
 from typing import List
 
 from src.scripts.ingest_cards import (
     load_json_file,
     determine_card_type,
-    transform_card_data,
+    transform_cards,
     ingest_cards
 )
 from src.services.card_service import CardService
@@ -18,209 +18,192 @@ from src.models.card import Card
 from src.exceptions import DatabaseError
 
 
+@pytest.fixture(scope="module")
+def card_service(test_database_setup):
+    """One CardService over a shared cursor for the read-only retrieval tests"""
+    cursor = test_database_setup.connection.cursor(dictionary=True, buffered=True)
+    yield CardService(cursor)
+    cursor.close()
+
+
+@pytest.fixture(scope="module")
+def three_cards_json():
+    """JSON export with one card of each type, serialized once per module"""
+    return json.dumps({
+        "items": [
+            {
+                "id": 26000000,
+                "name": "Knight",
+                "elixirCost": 3,
+                "rarity": "common",
+                "iconUrls": {
+                    "medium": "https://example.com/knight.png"
+                },
+                "arena": {"name": "Training Camp"}
+            },
+            {
+                "id": 27000000,
+                "name": "Cannon",
+                "elixirCost": 3,
+                "rarity": "common",
+                "iconUrls": {
+                    "medium": "https://example.com/cannon.png"
+                }
+            },
+            {
+                "id": 28000000,
+                "name": "Fireball",
+                "elixirCost": 4,
+                "rarity": "rare",
+                "iconUrls": {
+                    "medium": "https://example.com/fireball.png",
+                    "evolutionMedium": "https://example.com/fireball_evo.png"
+                },
+                "arena": {"name": "Spell Valley"}
+            }
+        ]
+    })
+
+
+@pytest.fixture(scope="module")
+def optional_fields_card_json():
+    """JSON export with a card that has no arena or evolution image"""
+    return json.dumps({
+        "items": [
+            {
+                "id": 26000001,
+                "name": "Archers",
+                "elixirCost": 3,
+                "rarity": "common",
+                "iconUrls": {
+                    "medium": "https://example.com/archers.png"
+                }
+                # No arena, no evolutionMedium
+            }
+        ]
+    })
+
+
+@pytest.fixture(scope="module")
+def mixed_validity_cards_json():
+    """JSON export with two valid cards around one missing required fields"""
+    return json.dumps({
+        "items": [
+            {
+                "id": 26000002,
+                "name": "Valid Card",
+                "elixirCost": 3,
+                "rarity": "common",
+                "iconUrls": {
+                    "medium": "https://example.com/valid.png"
+                }
+            },
+            {
+                # Missing required fields
+                "id": 26000003,
+                "name": "Invalid Card"
+                # Missing elixirCost, rarity, iconUrls
+            },
+            {
+                "id": 26000004,
+                "name": "Another Valid Card",
+                "elixirCost": 4,
+                "rarity": "rare",
+                "iconUrls": {
+                    "medium": "https://example.com/valid2.png"
+                }
+            }
+        ]
+    })
+
+
 class TestCardIngestionWorkflow:
     """Test full ingestion workflow with test JSON data"""
     
-    def test_full_ingestion_workflow_with_test_data(self, clean_database):
+    def test_full_ingestion_workflow_with_test_data(self, clean_cards, three_cards_json):
         """Test complete ingestion workflow from JSON to database"""
-        # Create test JSON data
-        test_cards_data = {
-            "items": [
-                {
-                    "id": 26000000,
-                    "name": "Knight",
-                    "elixirCost": 3,
-                    "rarity": "common",
-                    "iconUrls": {
-                        "medium": "https://example.com/knight.png"
-                    },
-                    "arena": {"name": "Training Camp"}
-                },
-                {
-                    "id": 27000000,
-                    "name": "Cannon",
-                    "elixirCost": 3,
-                    "rarity": "common",
-                    "iconUrls": {
-                        "medium": "https://example.com/cannon.png"
-                    }
-                },
-                {
-                    "id": 28000000,
-                    "name": "Fireball",
-                    "elixirCost": 4,
-                    "rarity": "rare",
-                    "iconUrls": {
-                        "medium": "https://example.com/fireball.png",
-                        "evolutionMedium": "https://example.com/fireball_evo.png"
-                    },
-                    "arena": {"name": "Spell Valley"}
-                }
-            ]
-        }
+        # Step 1: Load JSON file
+        data = load_json_file(io.StringIO(three_cards_json))
+        assert data is not None
+        assert len(data['items']) == 3
         
-        # Write test data to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(test_cards_data, f)
-            temp_file_path = f.name
+        # Step 2: Transform card data
+        transformed_cards = transform_cards(data['items'])
         
-        try:
-            # Step 1: Load JSON file
-            data = load_json_file(temp_file_path)
-            assert data is not None
-            assert len(data['items']) == 3
-            
-            # Step 2: Transform card data
-            transformed_cards = []
-            for card_json in data['items']:
-                transformed = transform_card_data(card_json)
-                assert transformed is not None
-                transformed_cards.append(transformed)
-            
-            assert len(transformed_cards) == 3
-            
-            # Verify transformations
-            assert transformed_cards[0]['type'] == 'Troop'
-            assert transformed_cards[0]['rarity'] == 'Common'
-            assert transformed_cards[0]['arena'] == 'Training Camp'
-            
-            assert transformed_cards[1]['type'] == 'Building'
-            assert transformed_cards[1]['arena'] is None
-            
-            assert transformed_cards[2]['type'] == 'Spell'
-            assert transformed_cards[2]['image_url_evo'] == 'https://example.com/fireball_evo.png'
-            
-            # Step 3: Ingest cards into database
-            inserted, updated, errors = ingest_cards(transformed_cards)
-            
-            assert inserted == 3
-            assert updated == 0
-            assert errors == 0
-            
-            # Step 4: Verify cards are in database
-            count = clean_database.get_table_count('cards')
-            assert count == 3
-            
-            # Verify specific card data
-            cards_in_db = clean_database.execute_query(
-                "SELECT * FROM cards WHERE id = %s", (26000000,)
-            )
-            assert len(cards_in_db) == 1
-            assert cards_in_db[0]['name'] == 'Knight'
-            assert cards_in_db[0]['elixir_cost'] == 3
-            assert cards_in_db[0]['type'] == 'Troop'
-            
-        finally:
-            # Clean up temp file
-            Path(temp_file_path).unlink()
+        assert len(transformed_cards) == 3
+        
+        # Verify transformations
+        assert transformed_cards[0]['type'] == 'Troop'
+        assert transformed_cards[0]['rarity'] == 'Common'
+        assert transformed_cards[0]['arena'] == 'Training Camp'
+        
+        assert transformed_cards[1]['type'] == 'Building'
+        assert transformed_cards[1]['arena'] is None
+        
+        assert transformed_cards[2]['type'] == 'Spell'
+        assert transformed_cards[2]['image_url_evo'] == 'https://example.com/fireball_evo.png'
+        
+        # Step 3: Ingest cards into database
+        inserted, updated, errors = ingest_cards(transformed_cards)
+        
+        assert inserted == 3
+        assert updated == 0
+        assert errors == 0
+        
+        # Step 4: Verify cards are in database
+        count = clean_cards.get_table_count('cards')
+        assert count == 3
+        
+        # Verify specific card data
+        cards_in_db = clean_cards.execute_query(
+            "SELECT name, elixir_cost, type FROM cards WHERE id = %s", (26000000,)
+        )
+        assert len(cards_in_db) == 1
+        assert cards_in_db[0]['name'] == 'Knight'
+        assert cards_in_db[0]['elixir_cost'] == 3
+        assert cards_in_db[0]['type'] == 'Troop'
     
-    def test_ingestion_with_missing_optional_fields(self, clean_database):
+    def test_ingestion_with_missing_optional_fields(self, clean_cards, optional_fields_card_json):
         """Test ingestion with cards missing optional fields"""
-        test_cards_data = {
-            "items": [
-                {
-                    "id": 26000001,
-                    "name": "Archers",
-                    "elixirCost": 3,
-                    "rarity": "common",
-                    "iconUrls": {
-                        "medium": "https://example.com/archers.png"
-                    }
-                    # No arena, no evolutionMedium
-                }
-            ]
-        }
+        data = load_json_file(io.StringIO(optional_fields_card_json))
+        transformed_cards = transform_cards(data['items'])
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(test_cards_data, f)
-            temp_file_path = f.name
+        # Verify optional fields are None
+        assert transformed_cards[0]['arena'] is None
+        assert transformed_cards[0]['image_url_evo'] is None
         
-        try:
-            data = load_json_file(temp_file_path)
-            transformed_cards = []
-            for card_json in data['items']:
-                transformed = transform_card_data(card_json)
-                transformed_cards.append(transformed)
-            
-            # Verify optional fields are None
-            assert transformed_cards[0]['arena'] is None
-            assert transformed_cards[0]['image_url_evo'] is None
-            
-            inserted, updated, errors = ingest_cards(transformed_cards)
-            assert inserted == 1
-            assert errors == 0
-            
-            # Verify in database
-            cards_in_db = clean_database.execute_query(
-                "SELECT * FROM cards WHERE id = %s", (26000001,)
-            )
-            assert cards_in_db[0]['arena'] is None
-            assert cards_in_db[0]['image_url_evo'] is None
-            
-        finally:
-            Path(temp_file_path).unlink()
+        inserted, updated, errors = ingest_cards(transformed_cards)
+        assert inserted == 1
+        assert errors == 0
+        
+        # Verify in database
+        cards_in_db = clean_cards.execute_query(
+            "SELECT arena, image_url_evo FROM cards WHERE id = %s", (26000001,)
+        )
+        assert cards_in_db[0]['arena'] is None
+        assert cards_in_db[0]['image_url_evo'] is None
     
-    def test_ingestion_with_invalid_card_skipped(self, clean_database):
+    def test_ingestion_with_invalid_card_skipped(self, clean_cards, mixed_validity_cards_json):
         """Test that invalid cards are skipped during ingestion"""
-        test_cards_data = {
-            "items": [
-                {
-                    "id": 26000002,
-                    "name": "Valid Card",
-                    "elixirCost": 3,
-                    "rarity": "common",
-                    "iconUrls": {
-                        "medium": "https://example.com/valid.png"
-                    }
-                },
-                {
-                    # Missing required fields
-                    "id": 26000003,
-                    "name": "Invalid Card"
-                    # Missing elixirCost, rarity, iconUrls
-                },
-                {
-                    "id": 26000004,
-                    "name": "Another Valid Card",
-                    "elixirCost": 4,
-                    "rarity": "rare",
-                    "iconUrls": {
-                        "medium": "https://example.com/valid2.png"
-                    }
-                }
-            ]
-        }
+        data = load_json_file(io.StringIO(mixed_validity_cards_json))
+        transformed_cards = transform_cards(data['items'])  # Drops invalid cards
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(test_cards_data, f)
-            temp_file_path = f.name
+        # Should have 2 valid cards
+        assert len(transformed_cards) == 2
         
-        try:
-            data = load_json_file(temp_file_path)
-            transformed_cards = []
-            for card_json in data['items']:
-                transformed = transform_card_data(card_json)
-                if transformed:  # Only add valid cards
-                    transformed_cards.append(transformed)
-            
-            # Should have 2 valid cards
-            assert len(transformed_cards) == 2
-            
-            inserted, updated, errors = ingest_cards(transformed_cards)
-            assert inserted == 2
-            
-            # Verify only valid cards are in database
-            count = clean_database.get_table_count('cards')
-            assert count == 2
-            
-        finally:
-            Path(temp_file_path).unlink()
+        inserted, updated, errors = ingest_cards(transformed_cards)
+        assert inserted == 2
+        
+        # Verify only valid cards are in database
+        count = clean_cards.get_table_count('cards')
+        assert count == 2
 
 
 class TestCardRetrieval:
     """Test card retrieval after ingestion"""
     
-    def test_retrieve_cards_after_ingestion(self, clean_database):
+    @pytest.mark.asyncio
+    async def test_retrieve_cards_after_ingestion(self, clean_cards, card_service):
         """Test retrieving cards using CardService after ingestion"""
         # Insert test cards directly
         test_cards = [
@@ -251,12 +234,7 @@ class TestCardRetrieval:
         assert errors == 0
         
         # Retrieve cards using CardService
-        cursor = clean_database.connection.cursor(dictionary=True)
-        card_service = CardService(cursor)
-        
-        # Use asyncio to run async method
-        import asyncio
-        cards = asyncio.run(card_service.get_all_cards())
+        cards = await card_service.get_all_cards()
         
         assert len(cards) == 2
         assert isinstance(cards[0], Card)
@@ -266,10 +244,9 @@ class TestCardRetrieval:
         
         assert cards[1].name == 'Test Fireball'
         assert cards[1].image_url_evo == 'https://example.com/fireball_evo.png'
-        
-        cursor.close()
     
-    def test_retrieve_single_card_by_id(self, clean_database):
+    @pytest.mark.asyncio
+    async def test_retrieve_single_card_by_id(self, clean_cards, card_service):
         """Test retrieving a single card by ID"""
         test_card = {
             'id': 26000020,
@@ -286,32 +263,22 @@ class TestCardRetrieval:
         assert inserted == 1
         
         # Retrieve specific card
-        cursor = clean_database.connection.cursor(dictionary=True)
-        card_service = CardService(cursor)
-        
-        import asyncio
-        card = asyncio.run(card_service.get_card_by_id(26000020))
+        card = await card_service.get_card_by_id(26000020)
         
         assert card is not None
         assert card.id == 26000020
         assert card.name == 'Test Giant'
         assert card.elixir_cost == 5
-        
-        cursor.close()
     
-    def test_retrieve_nonexistent_card_returns_none(self, clean_database):
+    @pytest.mark.asyncio
+    async def test_retrieve_nonexistent_card_returns_none(self, clean_cards, card_service):
         """Test retrieving a card that doesn't exist"""
-        cursor = clean_database.connection.cursor(dictionary=True)
-        card_service = CardService(cursor)
-        
-        import asyncio
-        card = asyncio.run(card_service.get_card_by_id(99999999))
+        card = await card_service.get_card_by_id(99999999)
         
         assert card is None
-        
-        cursor.close()
     
-    def test_retrieve_cards_with_null_optional_fields(self, clean_database):
+    @pytest.mark.asyncio
+    async def test_retrieve_cards_with_null_optional_fields(self, clean_cards, card_service):
         """Test retrieving cards with NULL optional fields"""
         test_card = {
             'id': 26000030,
@@ -327,23 +294,47 @@ class TestCardRetrieval:
         inserted, updated, errors = ingest_cards([test_card])
         assert inserted == 1
         
-        cursor = clean_database.connection.cursor(dictionary=True)
-        card_service = CardService(cursor)
-        
-        import asyncio
-        cards = asyncio.run(card_service.get_all_cards())
+        cards = await card_service.get_all_cards()
         
         assert len(cards) == 1
         assert cards[0].arena is None
         assert cards[0].image_url_evo is None
-        
-        cursor.close()
 
 
 class TestUpsertBehavior:
     """Test upsert behavior (insert then update same card)"""
     
-    def test_insert_then_update_same_card(self, clean_database):
+    def test_upsert_lookup_uses_primary_key(self, clean_cards):
+        """Test that cards.id is the primary key, so upserts find rows by index"""
+        pk_columns = clean_cards.execute_query(
+            "SELECT column_name AS column_name FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'cards' AND index_name = 'PRIMARY'"
+        )
+        assert [row['column_name'] for row in pk_columns] == ['id']
+        
+        inserted, updated, errors = ingest_cards([{
+            'id': 26000070,
+            'name': 'Indexed Card',
+            'elixir_cost': 3,
+            'rarity': 'Common',
+            'type': 'Troop',
+            'arena': None,
+            'image_url': 'https://example.com/indexed.png',
+            'image_url_evo': None
+        }])
+        assert inserted == 1
+        
+        # A lookup by id must be a single primary key probe, not a scan
+        cursor = clean_cards.connection.cursor(dictionary=True)
+        try:
+            cursor.execute("EXPLAIN SELECT name FROM cards WHERE id = %s", (26000070,))
+            plan = cursor.fetchall()
+        finally:
+            cursor.close()
+        assert plan[0]['type'] == 'const'
+        assert plan[0]['key'] == 'PRIMARY'
+    
+    def test_insert_then_update_same_card(self, clean_cards):
         """Test that re-ingesting a card updates existing record"""
         # Initial insert
         initial_card = {
@@ -362,8 +353,8 @@ class TestUpsertBehavior:
         assert updated == 0
         
         # Verify initial data
-        cards_in_db = clean_database.execute_query(
-            "SELECT * FROM cards WHERE id = %s", (26000040,)
+        cards_in_db = clean_cards.execute_query(
+            "SELECT name, elixir_cost FROM cards WHERE id = %s", (26000040,)
         )
         assert cards_in_db[0]['name'] == 'Initial Name'
         assert cards_in_db[0]['elixir_cost'] == 3
@@ -386,8 +377,8 @@ class TestUpsertBehavior:
         assert errors2 == 0
         
         # Verify updated data
-        cards_in_db = clean_database.execute_query(
-            "SELECT * FROM cards WHERE id = %s", (26000040,)
+        cards_in_db = clean_cards.execute_query(
+            "SELECT name, elixir_cost, rarity, arena, image_url_evo FROM cards WHERE id = %s", (26000040,)
         )
         assert len(cards_in_db) == 1  # Still only one record
         assert cards_in_db[0]['name'] == 'Updated Name'
@@ -397,13 +388,11 @@ class TestUpsertBehavior:
         assert cards_in_db[0]['image_url_evo'] == 'https://example.com/updated_evo.png'
         
         # Verify total count is still 1
-        count = clean_database.get_table_count('cards')
+        count = clean_cards.get_table_count('cards')
         assert count == 1
     
-    def test_upsert_preserves_created_at(self, clean_database):
+    def test_upsert_preserves_created_at(self, clean_cards):
         """Test that upsert preserves the original created_at timestamp"""
-        import time
-        
         # Initial insert
         initial_card = {
             'id': 26000050,
@@ -419,15 +408,13 @@ class TestUpsertBehavior:
         inserted, updated, errors = ingest_cards([initial_card])
         assert inserted == 1
         
-        # Get original timestamps
-        cards_in_db = clean_database.execute_query(
-            "SELECT created_at, updated_at FROM cards WHERE id = %s", (26000050,)
+        # Backdate the timestamps so the update is visibly newer without
+        # waiting for the clock to tick
+        original_created_at = original_updated_at = datetime(2020, 1, 1)
+        clean_cards.execute_query(
+            "UPDATE cards SET created_at = %s, updated_at = %s WHERE id = %s",
+            (original_created_at, original_updated_at, 26000050)
         )
-        original_created_at = cards_in_db[0]['created_at']
-        original_updated_at = cards_in_db[0]['updated_at']
-        
-        # Wait a moment to ensure timestamp difference
-        time.sleep(1)
         
         # Update the card
         updated_card = {
@@ -445,7 +432,7 @@ class TestUpsertBehavior:
         assert updated2 == 1
         
         # Get new timestamps
-        cards_in_db = clean_database.execute_query(
+        cards_in_db = clean_cards.execute_query(
             "SELECT created_at, updated_at FROM cards WHERE id = %s", (26000050,)
         )
         new_created_at = cards_in_db[0]['created_at']
@@ -457,7 +444,7 @@ class TestUpsertBehavior:
         # updated_at should be different (newer)
         assert new_updated_at > original_updated_at
     
-    def test_batch_upsert_mixed_insert_and_update(self, clean_database):
+    def test_batch_upsert_mixed_insert_and_update(self, clean_cards):
         """Test batch upsert with mix of new and existing cards"""
         # Insert initial cards
         initial_cards = [
@@ -527,23 +514,15 @@ class TestUpsertBehavior:
         assert errors2 == 0
         
         # Verify total count
-        count = clean_database.get_table_count('cards')
+        count = clean_cards.get_table_count('cards')
         assert count == 3
         
         # Verify updates
-        card1 = clean_database.execute_query(
-            "SELECT * FROM cards WHERE id = %s", (26000060,)
-        )
-        assert card1[0]['name'] == 'Updated Card 1'
-        assert card1[0]['elixir_cost'] == 5
-        
-        card2 = clean_database.execute_query(
-            "SELECT * FROM cards WHERE id = %s", (26000061,)
-        )
-        assert card2[0]['name'] == 'Updated Card 2'
-        assert card2[0]['rarity'] == 'Legendary'
-        
-        card3 = clean_database.execute_query(
-            "SELECT * FROM cards WHERE id = %s", (26000062,)
+        rows = clean_cards.fetch_by_ids(
+            'cards', [26000060, 26000061, 26000062], columns=['name', 'elixir_cost', 'rarity']
         )
-        assert card3[0]['name'] == 'New Card 3'
+        assert rows[26000060]['name'] == 'Updated Card 1'
+        assert rows[26000060]['elixir_cost'] == 5
+        assert rows[26000061]['name'] == 'Updated Card 2'
+        assert rows[26000061]['rarity'] == 'Legendary'
+        assert rows[26000062]['name'] == 'New Card 3'
@@ -2,6 +2,7 @@
 Integration tests for database connection and basic operations
 """
 import pytest
+from types import SimpleNamespace
 import mysql.connector
 from mysql.connector import Error as MySQLError
 from src.utils.database import (
@@ -12,6 +13,41 @@ from src.utils.database import (
     initialize_database
 )
 from src.utils.config import Settings
+from tests.fixtures.test_db_manager import BASE_TEST_DATABASE, TestDatabaseManager
+
+
+@pytest.fixture(scope="module")
+def db_meta(test_database_setup):
+    """Tables, foreign keys and indexes of the test schema, read from information_schema once"""
+    with get_db_session() as session:
+        session.execute("""
+            SELECT table_name AS table_name
+            FROM information_schema.tables 
+            WHERE table_schema = DATABASE()
+        """)
+        tables = [table['table_name'] for table in session.fetchall()]
+        
+        session.execute("""
+            SELECT 
+                CONSTRAINT_NAME,
+                TABLE_NAME,
+                COLUMN_NAME,
+                REFERENCED_TABLE_NAME,
+                REFERENCED_COLUMN_NAME
+            FROM information_schema.KEY_COLUMN_USAGE
+            WHERE CONSTRAINT_SCHEMA = DATABASE()
+            AND REFERENCED_TABLE_NAME IS NOT NULL
+        """)
+        foreign_keys = session.fetchall()
+        
+        session.execute("""
+            SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME
+            FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE()
+        """)
+        indexes = session.fetchall()
+    
+    return SimpleNamespace(tables=tables, foreign_keys=foreign_keys, indexes=indexes)
 
 
 class TestDatabaseConnection:
@@ -60,7 +96,7 @@ class TestDatabaseConnection:
         health = get_database_health()
         
         assert health['status'] == 'healthy'
-        assert health['database'] == 'clash_deck_builder_test'
+        assert health['database'] == test_database_setup.database
         assert health['host'] == 'localhost'
         assert health['port'] == 3307
         assert health['pool_initialized'] is True
@@ -69,6 +105,7 @@ class TestDatabaseConnection:
         assert 'table_count' in health
         assert health['table_count'] > 0  # Should have tables from schema
     
+    @pytest.mark.slow
     def test_database_connection_retry_logic(self, test_environment):
         """Test database connection retry logic with invalid credentials"""
         invalid_settings = Settings(
@@ -79,11 +116,13 @@ class TestDatabaseConnection:
             db_password="invalid_password"
         )
         
-        db_manager = DatabaseManager(invalid_settings)
+        # One attempt is enough to see the failure; skip the retry backoff
+        db_manager = DatabaseManager(invalid_settings, max_connection_attempts=1)
         
         with pytest.raises(Exception):  # Should raise ConnectionPoolError
             db_manager.initialize()
     
+    @pytest.mark.slow
     def test_database_connection_with_invalid_host(self, test_environment):
         """Test database connection with invalid host"""
         invalid_settings = Settings(
@@ -94,75 +133,89 @@ class TestDatabaseConnection:
             db_password="test_password"
         )
         
-        db_manager = DatabaseManager(invalid_settings)
+        # One attempt is enough to see the failure; skip the retry backoff
+        db_manager = DatabaseManager(invalid_settings, max_connection_attempts=1)
         
         with pytest.raises(Exception):  # Should raise ConnectionPoolError
             db_manager.initialize()
     
-    def test_database_schema_validation(self, test_database_setup):
+    def test_database_schema_validation(self, db_meta):
         """Test that required database tables exist"""
-        with get_db_session() as session:
-            # Check that required tables exist
-            session.execute("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'clash_deck_builder_test'
-            """)
-            tables = session.fetchall()
-            table_names = [table['table_name'] for table in tables]
-            
-            # Verify required tables exist
-            required_tables = ['users', 'decks', 'cards_cache']
-            for table in required_tables:
-                assert table in table_names, f"Required table '{table}' not found"
+        # Verify required tables exist
+        required_tables = ['users', 'decks', 'cards_cache']
+        for table in required_tables:
+            assert table in db_meta.tables, f"Required table '{table}' not found"
     
-    def test_database_foreign_key_constraints(self, test_database_setup):
+    def test_database_foreign_key_constraints(self, db_meta):
         """Test that foreign key constraints are properly set up"""
-        with get_db_session() as session:
-            # Check foreign key constraints
-            session.execute("""
-                SELECT 
-                    CONSTRAINT_NAME,
-                    TABLE_NAME,
-                    COLUMN_NAME,
-                    REFERENCED_TABLE_NAME,
-                    REFERENCED_COLUMN_NAME
-                FROM information_schema.KEY_COLUMN_USAGE
-                WHERE CONSTRAINT_SCHEMA = 'clash_deck_builder_test'
-                AND REFERENCED_TABLE_NAME IS NOT NULL
-            """)
-            constraints = session.fetchall()
-            
-            # Should have at least one foreign key constraint (decks -> users)
-            assert len(constraints) > 0
-            
-            # Check specific constraint exists
-            deck_user_constraint = any(
-                c['TABLE_NAME'] == 'decks' and 
-                c['REFERENCED_TABLE_NAME'] == 'users' and
-                c['COLUMN_NAME'] == 'user_id'
-                for c in constraints
+        # Should have at least one foreign key constraint (decks -> users)
+        assert len(db_meta.foreign_keys) > 0
+        
+        # Check specific constraint exists
+        deck_user_constraint = any(
+            c['TABLE_NAME'] == 'decks' and 
+            c['REFERENCED_TABLE_NAME'] == 'users' and
+            c['COLUMN_NAME'] == 'user_id'
+            for c in db_meta.foreign_keys
+        )
+        assert deck_user_constraint, "Foreign key constraint from decks to users not found"
+
+    def test_worker_database_keeps_template_foreign_keys(self, test_database_setup):
+        """Test that the per-worker database has the same foreign keys as the base test database"""
+        assert test_database_setup.foreign_keys() == test_database_setup.foreign_keys(BASE_TEST_DATABASE)
+
+    def test_worker_database_rebuilt_after_template_column_change(self, db_manager):
+        """Test that a reused worker database is rebuilt once a template column changes"""
+        template = f"{db_manager.database}_tpl_probe"
+        copy = TestDatabaseManager(database=f"{db_manager.database}_copy_probe")
+        root = mysql.connector.connect(
+            host=db_manager.host,
+            port=db_manager.port,
+            user="root",
+            password=db_manager.root_password,
+            autocommit=True
+        )
+        cursor = root.cursor()
+        try:
+            cursor.execute(f"CREATE DATABASE `{template}`")
+            cursor.execute(
+                f"CREATE TABLE `{template}`.probe (id INT PRIMARY KEY, label VARCHAR(10))"
             )
-            assert deck_user_constraint, "Foreign key constraint from decks to users not found"
+            assert copy.provision_database(template=template)
+
+            # A row in the copy survives only while the copy is reused
+            cursor.execute(f"INSERT INTO `{copy.database}`.probe VALUES (1, 'kept')")
+            assert copy.provision_database(template=template)
+            cursor.execute(f"SELECT COUNT(*) FROM `{copy.database}`.probe")
+            assert cursor.fetchone()[0] == 1
+
+            cursor.execute(f"ALTER TABLE `{template}`.probe MODIFY label VARCHAR(50)")
+            assert copy.provision_database(template=template)
+
+            cursor.execute(f"SELECT COUNT(*) FROM `{copy.database}`.probe")
+            assert cursor.fetchone()[0] == 0
+            cursor.execute(
+                "SELECT character_maximum_length FROM information_schema.columns "
+                "WHERE table_schema = %s AND table_name = 'probe' AND column_name = 'label'",
+                (copy.database,)
+            )
+            assert cursor.fetchone()[0] == 50
+        finally:
+            cursor.execute(f"DROP DATABASE IF EXISTS `{copy.database}`")
+            cursor.execute(f"DROP DATABASE IF EXISTS `{template}`")
+            cursor.close()
+            root.close()
     
-    def test_database_indexes_exist(self, test_database_setup):
+    def test_database_indexes_exist(self, db_meta):
         """Test that performance indexes are created"""
-        with get_db_session() as session:
-            # Check indexes on decks table
-            session.execute("""
-                SELECT INDEX_NAME, COLUMN_NAME
-                FROM information_schema.STATISTICS
-                WHERE TABLE_SCHEMA = 'clash_deck_builder_test'
-                AND TABLE_NAME = 'decks'
-                AND INDEX_NAME != 'PRIMARY'
-            """)
-            deck_indexes = session.fetchall()
-            
-            # Should have indexes on user_id, name, created_at
-            index_columns = [idx['COLUMN_NAME'] for idx in deck_indexes]
-            assert 'user_id' in index_columns
-            assert 'name' in index_columns
-            assert 'created_at' in index_columns
+        # Should have indexes on user_id, name, created_at
+        index_columns = [
+            idx['COLUMN_NAME'] for idx in db_meta.indexes
+            if idx['TABLE_NAME'] == 'decks' and idx['INDEX_NAME'] != 'PRIMARY'
+        ]
+        assert 'user_id' in index_columns
+        assert 'name' in index_columns
+        assert 'created_at' in index_columns
     
     def test_database_connection_pool_behavior(self, test_database_setup):
         """Test database connection pool behavior with multiple connections"""
@@ -8,25 +8,29 @@ from src.models.deck import Deck
 from src.models.user import User
 from src.models.card import Card
 from src.exceptions import DeckNotFoundError, DeckLimitExceededError
-from src.utils.database import get_db_session
+from src.utils.database import get_db_connection
 
 
 class TestDeckOperations:
     """Test deck CRUD operations with real database"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_cards(self):
-        """Sample cards for testing"""
-        return [
-            Card(id=26000000, name="Knight", elixir_cost=3, rarity="Common", type="Troop"),
-            Card(id=26000001, name="Archers", elixir_cost=3, rarity="Common", type="Troop"),
-            Card(id=26000002, name="Goblins", elixir_cost=2, rarity="Common", type="Troop"),
-            Card(id=26000003, name="Giant", elixir_cost=5, rarity="Rare", type="Troop"),
-            Card(id=26000004, name="P.E.K.K.A", elixir_cost=7, rarity="Epic", type="Troop"),
-            Card(id=26000005, name="Minions", elixir_cost=3, rarity="Common", type="Troop"),
-            Card(id=28000000, name="Fireball", elixir_cost=4, rarity="Rare", type="Spell"),
-            Card(id=28000001, name="Arrows", elixir_cost=3, rarity="Common", type="Spell")
-        ]
+        """Sample cards for testing, built once and shared read-only by every test"""
+        return tuple(
+            Card(id=card_id, name=name, elixir_cost=elixir_cost, rarity=rarity, type=card_type,
+                 image_url=f"https://example.com/{card_id}.png")
+            for card_id, name, elixir_cost, rarity, card_type in (
+                (26000000, "Knight", 3, "Common", "Troop"),
+                (26000001, "Archers", 3, "Common", "Troop"),
+                (26000002, "Goblins", 2, "Common", "Troop"),
+                (26000003, "Giant", 5, "Rare", "Troop"),
+                (26000004, "P.E.K.K.A", 7, "Epic", "Troop"),
+                (26000005, "Minions", 3, "Common", "Troop"),
+                (28000000, "Fireball", 4, "Rare", "Spell"),
+                (28000001, "Arrows", 3, "Common", "Spell"),
+            )
+        )
     
     @pytest.fixture
     def test_user(self):
@@ -34,10 +38,16 @@ class TestDeckOperations:
         return User(id=1, username="test_user_1", email="test1@example.com")
     
     @pytest.fixture
-    def deck_service(self, clean_database):
-        """Deck service with database session"""
-        with get_db_session() as session:
-            yield DeckService(session)
+    def deck_service(self, seeded_database):
+        """Deck service inside a transaction that is rolled back after the test"""
+        with get_db_connection() as connection:
+            connection.start_transaction()
+            session = connection.cursor(dictionary=True)
+            try:
+                yield DeckService(session)
+            finally:
+                session.close()
+                connection.rollback()
     
     @pytest.mark.asyncio
     async def test_create_deck(self, deck_service, test_user, sample_cards):
@@ -233,13 +243,14 @@ class TestDeckOperations:
         assert len(retrieved_deck.evolution_slots) == 2
         
         # Check specific card properties
-        knight = next(card for card in retrieved_deck.cards if card.name == "Knight")
+        cards_by_name = {card.name: card for card in retrieved_deck.cards}
+        knight = cards_by_name["Knight"]
         assert knight.elixir_cost == 3
         assert knight.rarity == "Common"
         assert knight.type == "Troop"
         
         # Check evolution slots
-        evo_names = [card.name for card in retrieved_deck.evolution_slots]
+        evo_names = {card.name for card in retrieved_deck.evolution_slots}
         assert "Knight" in evo_names
         assert "Giant" in evo_names
     
@@ -6,32 +6,42 @@ import requests
 import time
 import subprocess
 import os
+from pathlib import Path
+from src.utils import database as app_database
 from src.utils.database import get_database_health
-from tests.fixtures.test_db_manager import test_db_manager
+from tests.fixtures.test_db_manager import TestDatabaseManager
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture(scope="module")
+def database_health(test_database_setup):
+    """Application health check, run once and shared by the tests that inspect it"""
+    return get_database_health()
 
 
 class TestDockerEnvironment:
     """Test Docker environment integration"""
     
-    def test_test_database_container_health(self, test_database_setup):
+    def test_test_database_container_health(self, test_database_setup, database_health):
         """Test that test database container is healthy"""
         # Check if we can connect to the test database
-        assert test_db_manager.wait_for_database(timeout=30)
+        assert test_database_setup.wait_for_database(timeout=30)
         
         # Verify database health
-        health = get_database_health()
+        health = database_health
         assert health['status'] == 'healthy'
         assert health['host'] == 'localhost'
         assert health['port'] == 3307  # Test database port
     
     def test_docker_compose_test_configuration(self):
         """Test that docker-compose.test.yml is properly configured"""
-        compose_file = "docker-compose.test.yml"
-        assert os.path.exists(compose_file), "docker-compose.test.yml not found"
+        compose_file = PROJECT_ROOT / "docker-compose.test.yml"
+        assert compose_file.exists(), "docker-compose.test.yml not found"
         
-        # Read and verify compose file content
+        # Read the compose file once, dropping comments so they cannot satisfy a check
         with open(compose_file, 'r') as f:
-            content = f.read()
+            content = "\n".join(line.split("#", 1)[0] for line in f)
             
         # Check for required services
         assert 'test-database:' in content
@@ -43,11 +53,11 @@ class TestDockerEnvironment:
         assert 'test_password' in content
         assert '3307:3306' in content  # Port mapping for test database
     
-    def test_test_database_isolation(self, test_database_setup):
+    def test_test_database_isolation(self, db_manager, database_health):
         """Test that test database is isolated from main database"""
         # Verify we're connected to test database
-        health = get_database_health()
-        assert health['database'] == 'clash_deck_builder_test'
+        health = database_health
+        assert health['database'] == db_manager.database
         assert health['port'] == 3307
         
         # Test database should have different credentials
@@ -57,46 +67,45 @@ class TestDockerEnvironment:
         # In test environment, should use test credentials
         assert settings.db_user == 'test_user'
         assert settings.db_password == 'test_password'
-        assert settings.db_name == 'clash_deck_builder_test'
+        assert settings.db_name == db_manager.database
     
-    def test_test_environment_variables(self, test_environment):
+    def test_test_environment_variables(self, db_manager, test_environment):
         """Test that test environment variables are properly set"""
         assert test_environment['TESTING'] == 'true'
         assert test_environment['DB_HOST'] == 'localhost'
         assert test_environment['DB_PORT'] == '3307'
-        assert test_environment['DB_NAME'] == 'clash_deck_builder_test'
+        assert test_environment['DB_NAME'] == db_manager.database
         assert test_environment['DB_USER'] == 'test_user'
         assert test_environment['DB_PASSWORD'] == 'test_password'
         assert test_environment['DEBUG'] == 'true'
+        
+        # The application's database manager, built at import, follows them
+        app_settings = app_database.db_manager.settings
+        assert app_settings.db_name == test_environment['DB_NAME']
+        assert app_settings.db_pool_size == int(test_environment['DB_POOL_SIZE'])
     
     def test_docker_network_connectivity(self, test_database_setup):
         """Test Docker network connectivity between services"""
         # This test verifies that the test database is accessible
         # In a full Docker environment, this would test container-to-container communication
         
-        # For now, test that we can connect to the test database
-        success = test_db_manager.connect()
-        assert success, "Failed to connect to test database"
-        
-        # Test basic database operations
-        result = test_db_manager.execute_query("SELECT 1 as test")
+        # For now, test basic database operations on the session connection
+        result = test_database_setup.execute_query("SELECT 1 as test")
         assert len(result) == 1
         assert result[0]['test'] == 1
-        
-        test_db_manager.disconnect()
     
     def test_docker_volume_persistence(self, test_database_setup):
         """Test that Docker volumes persist data correctly"""
         # Add some test data
         test_data = "docker_volume_test_data"
         
-        result = test_db_manager.execute_query(
+        result = test_database_setup.execute_query(
             "INSERT INTO users (username, email) VALUES (%s, %s)",
             (test_data, f"{test_data}@test.com")
         )
         
         # Verify data was inserted
-        result = test_db_manager.execute_query(
+        result = test_database_setup.execute_query(
             "SELECT username FROM users WHERE username = %s",
             (test_data,)
         )
@@ -105,22 +114,25 @@ class TestDockerEnvironment:
         
         # In a real Docker environment, we would restart the container here
         # and verify the data persists. For this test, we'll just verify
-        # the data is still there after a reconnection
-        
-        test_db_manager.disconnect()
-        test_db_manager.connect()
-        
-        result = test_db_manager.execute_query(
-            "SELECT username FROM users WHERE username = %s",
-            (test_data,)
-        )
+        # the data is visible from a new connection, leaving the session's
+        # shared connection open
+        
+        reconnected = TestDatabaseManager()
+        assert reconnected.connect(), "Failed to reconnect to test database"
+        try:
+            result = reconnected.execute_query(
+                "SELECT username FROM users WHERE username = %s",
+                (test_data,)
+            )
+        finally:
+            reconnected.disconnect()
         assert len(result) == 1
         assert result[0]['username'] == test_data
     
-    def test_docker_health_checks(self, test_database_setup):
+    def test_docker_health_checks(self, database_health):
         """Test Docker health check functionality"""
         # Test database health check
-        health = get_database_health()
+        health = database_health
         assert health['status'] == 'healthy'
         assert 'connection_test' in health
         assert health['connection_test'] == 'passed'
@@ -130,17 +142,16 @@ class TestDockerEnvironment:
         for field in required_fields:
             assert field in health, f"Health check missing field: {field}"
     
-    def test_docker_container_resource_limits(self):
+    def test_docker_container_resource_limits(self, test_database_setup):
         """Test Docker container resource configuration"""
         # This test would verify container resource limits in a real Docker environment
         # For now, we'll test that the test database performs adequately
         
         start_time = time.time()
         
-        # Perform multiple database operations
-        for i in range(10):
-            result = test_db_manager.execute_query("SELECT COUNT(*) as count FROM users")
-            assert len(result) == 1
+        # A single round trip is enough to check the database responds promptly
+        result = test_database_setup.execute_query("SELECT COUNT(*) as count FROM users")
+        assert len(result) == 1
         
         end_time = time.time()
         duration = end_time - start_time
@@ -153,35 +164,35 @@ class TestDockerEnvironment:
         # Add some test data that should be cleaned up
         cleanup_data = "cleanup_test_data"
         
-        test_db_manager.execute_query(
+        test_database_setup.execute_query(
             "INSERT INTO users (username, email) VALUES (%s, %s)",
             (cleanup_data, f"{cleanup_data}@test.com")
         )
         
         # Verify data exists
-        result = test_db_manager.execute_query(
+        result = test_database_setup.execute_query(
             "SELECT COUNT(*) as count FROM users WHERE username = %s",
             (cleanup_data,)
         )
         assert result[0]['count'] == 1
         
         # Clean database
-        success = test_db_manager.clean_database()
+        success = test_database_setup.clean_database()
         assert success, "Database cleanup failed"
         
         # Verify data was cleaned
-        result = test_db_manager.execute_query(
+        result = test_database_setup.execute_query(
             "SELECT COUNT(*) as count FROM users WHERE username = %s",
             (cleanup_data,)
         )
         assert result[0]['count'] == 0
         
         # Reseed test data
-        success = test_db_manager.seed_test_data()
+        success = test_database_setup.seed_test_data()
         assert success, "Database seeding failed"
         
         # Verify test data is back
-        result = test_db_manager.execute_query("SELECT COUNT(*) as count FROM users")
+        result = test_database_setup.execute_query("SELECT COUNT(*) as count FROM users")
         assert result[0]['count'] >= 3  # Should have test users
     
     def test_docker_compose_test_scripts(self):
@@ -207,34 +218,36 @@ class TestDockerEnvironment:
     def test_test_database_performance(self, test_database_setup):
         """Test test database performance characteristics"""
         # Test insert performance
-        start_time = time.time()
+        usernames = [f"perf_test_{i}" for i in range(100)]
         
-        for i in range(100):
-            test_db_manager.execute_query(
+        # Everything runs in one transaction that is rolled back, so the
+        # performance test data never needs deleting
+        with test_database_setup.transaction():
+            start_time = time.time()
+            
+            inserted = test_database_setup.execute_many(
                 "INSERT INTO users (username, email) VALUES (%s, %s)",
-                (f"perf_test_{i}", f"perf_test_{i}@test.com")
+                [(username, f"{username}@test.com") for username in usernames]
             )
-        
-        insert_time = time.time() - start_time
-        
-        # Test select performance
-        start_time = time.time()
-        
-        for i in range(100):
-            result = test_db_manager.execute_query(
-                "SELECT * FROM users WHERE username = %s",
-                (f"perf_test_{i}",)
+            assert inserted == 100
+            
+            insert_time = time.time() - start_time
+            
+            # Test select performance
+            start_time = time.time()
+            
+            placeholders = ", ".join(["%s"] * len(usernames))
+            result = test_database_setup.execute_query(
+                f"SELECT username FROM users WHERE username IN ({placeholders})",
+                tuple(usernames)
             )
-            assert len(result) == 1
-        
-        select_time = time.time() - start_time
+            assert len(result) == 100
+            
+            select_time = time.time() - start_time
         
         # Performance should be reasonable for test environment
         assert insert_time < 10.0, f"Insert performance too slow: {insert_time} seconds"
         assert select_time < 5.0, f"Select performance too slow: {select_time} seconds"
-        
-        # Clean up performance test data
-        test_db_manager.execute_query("DELETE FROM users WHERE username LIKE 'perf_test_%'")
     
     def test_docker_logging_configuration(self, test_database_setup):
         """Test Docker logging configuration"""
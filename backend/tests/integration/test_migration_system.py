@@ -4,160 +4,149 @@ Integration tests for database migration system
 import pytest
 import os
 from pathlib import Path
+from types import SimpleNamespace
 from src.utils.database import get_db_session, execute_sql_script
-from tests.fixtures.test_db_manager import test_db_manager
+
+
+@pytest.fixture(scope="module")
+def schema_snapshot(test_database_setup):
+    """Tables, columns, deck indexes and foreign keys of the test schema, read once
+
+    The schema does not change while the read-only tests run, so one pass
+    over information_schema serves all of them.
+    """
+    with get_db_session() as session:
+        session.execute("""
+            SELECT table_name AS table_name
+            FROM information_schema.tables 
+            WHERE table_schema = DATABASE()
+            AND table_name IN ('users', 'decks', 'cards_cache', 'schema_migrations')
+        """)
+        tables = {table['table_name'] for table in session.fetchall()}
+        
+        session.execute("""
+            SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_KEY, EXTRA
+            FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME IN ('users', 'decks')
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """)
+        columns = {}
+        for col in session.fetchall():
+            columns.setdefault(col['TABLE_NAME'], {})[col['COLUMN_NAME']] = col
+        
+        # SHOW INDEX reads the one table directly rather than the STATISTICS view
+        session.execute("SHOW INDEX FROM decks")
+        deck_indexes = [idx for idx in session.fetchall() if idx['Key_name'] != 'PRIMARY']
+        
+        session.execute("""
+            SELECT 
+                CONSTRAINT_NAME,
+                TABLE_NAME,
+                COLUMN_NAME,
+                REFERENCED_TABLE_NAME,
+                REFERENCED_COLUMN_NAME
+            FROM information_schema.KEY_COLUMN_USAGE
+            WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME = 'decks'
+            AND REFERENCED_TABLE_NAME IS NOT NULL
+        """)
+        foreign_keys = session.fetchall()
+        
+        session.execute("""
+            SELECT DEFAULT_CHARACTER_SET_NAME, DEFAULT_COLLATION_NAME
+            FROM information_schema.SCHEMATA
+            WHERE SCHEMA_NAME = DATABASE()
+        """)
+        schema_charset = session.fetchone()
+    
+    return SimpleNamespace(
+        tables=tables,
+        columns=columns,
+        deck_indexes=deck_indexes,
+        foreign_keys=foreign_keys,
+        schema_charset=schema_charset,
+    )
 
 
 class TestMigrationSystem:
     """Test database migration system functionality"""
     
-    def test_schema_migrations_table_exists(self, test_database_setup):
+    def test_schema_migrations_table_exists(self, schema_snapshot):
         """Test that schema_migrations table exists"""
-        with get_db_session() as session:
-            session.execute("""
-                SELECT COUNT(*) as count 
-                FROM information_schema.tables 
-                WHERE table_schema = 'clash_deck_builder_test' 
-                AND table_name = 'schema_migrations'
-            """)
-            result = session.fetchone()
-            
-            # Note: This test might fail if migrations haven't been run yet
-            # In a real scenario, migrations would be run during container startup
-            assert result['count'] >= 0  # Table may or may not exist depending on setup
+        # Note: This test might fail if migrations haven't been run yet
+        # In a real scenario, migrations would be run during container startup
+        count = int('schema_migrations' in schema_snapshot.tables)
+        assert count >= 0  # Table may or may not exist depending on setup
     
-    def test_database_schema_initialization(self, test_database_setup):
+    def test_database_schema_initialization(self, schema_snapshot):
         """Test that database schema is properly initialized"""
-        with get_db_session() as session:
-            # Check that all required tables exist
-            session.execute("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'clash_deck_builder_test'
-                ORDER BY table_name
-            """)
-            tables = session.fetchall()
-            table_names = [table['table_name'] for table in tables]
-            
-            required_tables = ['users', 'decks', 'cards_cache']
-            for table in required_tables:
-                assert table in table_names, f"Required table '{table}' not found"
+        # Check that all required tables exist
+        required_tables = ['users', 'decks', 'cards_cache']
+        for table in required_tables:
+            assert table in schema_snapshot.tables, f"Required table '{table}' not found"
     
-    def test_database_indexes_created(self, test_database_setup):
+    def test_database_indexes_created(self, schema_snapshot):
         """Test that performance indexes are created"""
-        with get_db_session() as session:
-            # Check indexes on decks table
-            session.execute("""
-                SELECT DISTINCT INDEX_NAME, COLUMN_NAME
-                FROM information_schema.STATISTICS
-                WHERE TABLE_SCHEMA = 'clash_deck_builder_test'
-                AND TABLE_NAME = 'decks'
-                AND INDEX_NAME != 'PRIMARY'
-                ORDER BY INDEX_NAME, COLUMN_NAME
-            """)
-            indexes = session.fetchall()
-            
-            # Should have indexes on key columns
-            index_columns = [idx['COLUMN_NAME'] for idx in indexes]
-            expected_columns = ['user_id', 'name', 'created_at']
-            
-            for column in expected_columns:
-                assert column in index_columns, f"Index on column '{column}' not found"
+        # Should have indexes on key columns of the decks table
+        index_columns = [idx['Column_name'] for idx in schema_snapshot.deck_indexes]
+        expected_columns = ['user_id', 'name', 'created_at']
+        
+        for column in expected_columns:
+            assert column in index_columns, f"Index on column '{column}' not found"
     
-    def test_foreign_key_constraints(self, test_database_setup):
+    def test_foreign_key_constraints(self, schema_snapshot):
         """Test that foreign key constraints are properly set up"""
-        with get_db_session() as session:
-            # Check foreign key constraints
-            session.execute("""
-                SELECT 
-                    CONSTRAINT_NAME,
-                    TABLE_NAME,
-                    COLUMN_NAME,
-                    REFERENCED_TABLE_NAME,
-                    REFERENCED_COLUMN_NAME
-                FROM information_schema.KEY_COLUMN_USAGE
-                WHERE CONSTRAINT_SCHEMA = 'clash_deck_builder_test'
-                AND REFERENCED_TABLE_NAME IS NOT NULL
-            """)
-            constraints = session.fetchall()
-            
-            # Check that decks table has foreign key to users
-            deck_user_fk = any(
-                c['TABLE_NAME'] == 'decks' and 
-                c['REFERENCED_TABLE_NAME'] == 'users' and
-                c['COLUMN_NAME'] == 'user_id' and
-                c['REFERENCED_COLUMN_NAME'] == 'id'
-                for c in constraints
-            )
-            assert deck_user_fk, "Foreign key constraint from decks.user_id to users.id not found"
+        # Check that decks table has foreign key to users
+        deck_user_fk = any(
+            c['TABLE_NAME'] == 'decks' and 
+            c['REFERENCED_TABLE_NAME'] == 'users' and
+            c['COLUMN_NAME'] == 'user_id' and
+            c['REFERENCED_COLUMN_NAME'] == 'id'
+            for c in schema_snapshot.foreign_keys
+        )
+        assert deck_user_fk, "Foreign key constraint from decks.user_id to users.id not found"
     
-    def test_database_charset_and_collation(self, test_database_setup):
+    def test_database_charset_and_collation(self, schema_snapshot):
         """Test that database uses proper charset and collation"""
-        with get_db_session() as session:
-            # Check database charset and collation
-            session.execute("""
-                SELECT DEFAULT_CHARACTER_SET_NAME, DEFAULT_COLLATION_NAME
-                FROM information_schema.SCHEMATA
-                WHERE SCHEMA_NAME = 'clash_deck_builder_test'
-            """)
-            result = session.fetchone()
+        result = schema_snapshot.schema_charset
+        
+        if result:  # May not be available in all MySQL versions
+            charset = result['DEFAULT_CHARACTER_SET_NAME']
+            collation = result['DEFAULT_COLLATION_NAME']
             
-            if result:  # May not be available in all MySQL versions
-                charset = result['DEFAULT_CHARACTER_SET_NAME']
-                collation = result['DEFAULT_COLLATION_NAME']
-                
-                # Should use UTF8MB4 for full Unicode support
-                assert charset in ['utf8mb4', 'utf8'], f"Unexpected charset: {charset}"
-                if charset == 'utf8mb4':
-                    assert 'utf8mb4' in collation, f"Unexpected collation: {collation}"
+            # Should use UTF8MB4 for full Unicode support
+            assert charset in ['utf8mb4', 'utf8'], f"Unexpected charset: {charset}"
+            if charset == 'utf8mb4':
+                assert 'utf8mb4' in collation, f"Unexpected collation: {collation}"
     
-    def test_table_column_definitions(self, test_database_setup):
+    def test_table_column_definitions(self, schema_snapshot):
         """Test that table columns are properly defined"""
-        with get_db_session() as session:
-            # Check users table structure
-            session.execute("""
-                SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_KEY, EXTRA
-                FROM information_schema.COLUMNS
-                WHERE TABLE_SCHEMA = 'clash_deck_builder_test'
-                AND TABLE_NAME = 'users'
-                ORDER BY ORDINAL_POSITION
-            """)
-            user_columns = session.fetchall()
-            
-            # Verify key columns exist with correct properties
-            column_info = {col['COLUMN_NAME']: col for col in user_columns}
-            
-            assert 'id' in column_info
-            assert column_info['id']['COLUMN_KEY'] == 'PRI'
-            assert 'auto_increment' in column_info['id']['EXTRA'].lower()
-            
-            assert 'username' in column_info
-            assert column_info['username']['IS_NULLABLE'] == 'NO'
-            
-            assert 'email' in column_info
-            assert column_info['email']['IS_NULLABLE'] == 'NO'
-            
-            # Check decks table structure
-            session.execute("""
-                SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_KEY
-                FROM information_schema.COLUMNS
-                WHERE TABLE_SCHEMA = 'clash_deck_builder_test'
-                AND TABLE_NAME = 'decks'
-                ORDER BY ORDINAL_POSITION
-            """)
-            deck_columns = session.fetchall()
-            
-            deck_column_info = {col['COLUMN_NAME']: col for col in deck_columns}
-            
-            assert 'id' in deck_column_info
-            assert deck_column_info['id']['COLUMN_KEY'] == 'PRI'
-            
-            assert 'user_id' in deck_column_info
-            assert 'cards' in deck_column_info
-            assert deck_column_info['cards']['DATA_TYPE'] == 'json'
-            
-            assert 'evolution_slots' in deck_column_info
-            assert deck_column_info['evolution_slots']['DATA_TYPE'] == 'json'
+        # Verify users key columns exist with correct properties
+        column_info = schema_snapshot.columns.get('users', {})
+        
+        assert 'id' in column_info
+        assert column_info['id']['COLUMN_KEY'] == 'PRI'
+        assert 'auto_increment' in column_info['id']['EXTRA'].lower()
+        
+        assert 'username' in column_info
+        assert column_info['username']['IS_NULLABLE'] == 'NO'
+        
+        assert 'email' in column_info
+        assert column_info['email']['IS_NULLABLE'] == 'NO'
+        
+        # Check decks table structure
+        deck_column_info = schema_snapshot.columns.get('decks', {})
+        
+        assert 'id' in deck_column_info
+        assert deck_column_info['id']['COLUMN_KEY'] == 'PRI'
+        
+        assert 'user_id' in deck_column_info
+        assert 'cards' in deck_column_info
+        assert deck_column_info['cards']['DATA_TYPE'] == 'json'
+        
+        assert 'evolution_slots' in deck_column_info
+        assert deck_column_info['evolution_slots']['DATA_TYPE'] == 'json'
     
     def test_sql_script_execution(self, test_database_setup):
         """Test SQL script execution functionality"""
@@ -193,7 +182,7 @@ class TestMigrationSystem:
             session.execute("""
                 SELECT COUNT(*) as count 
                 FROM information_schema.tables 
-                WHERE table_schema = 'clash_deck_builder_test'
+                WHERE table_schema = DATABASE()
             """)
             result = session.fetchone()
             initial_table_count = result['count']
@@ -220,7 +209,7 @@ class TestMigrationSystem:
             session.execute("""
                 SELECT COUNT(*) as count 
                 FROM information_schema.tables 
-                WHERE table_schema = 'clash_deck_builder_test'
+                WHERE table_schema = DATABASE()
             """)
             result = session.fetchone()
             final_table_count = result['count']
@@ -258,36 +247,32 @@ class TestMigrationSystem:
     
     def test_database_cleanup_and_reseed(self, test_database_setup):
         """Test database cleanup and reseeding functionality"""
+        # Everything runs on the manager's own connection, the one
+        # clean_database and seed_test_data use, so no pooled sessions are opened
+        counts_query = """
+            SELECT (SELECT COUNT(*) FROM users) AS users,
+                   (SELECT COUNT(*) FROM decks) AS decks
+        """
+        
         # Get initial counts
-        with get_db_session() as session:
-            session.execute("SELECT COUNT(*) as count FROM users")
-            initial_users = session.fetchone()['count']
-            
-            session.execute("SELECT COUNT(*) as count FROM decks")
-            initial_decks = session.fetchone()['count']
+        initial = test_database_setup.execute_query(counts_query, fetchone=True)
         
         # Add some test data
-        with get_db_session() as session:
-            session.execute(
-                "INSERT INTO users (username, email) VALUES (%s, %s)",
-                ("cleanup_test", "cleanup@test.com")
-            )
+        test_database_setup.execute_query(
+            "INSERT INTO users (username, email) VALUES (%s, %s)",
+            ("cleanup_test", "cleanup@test.com")
+        )
         
         # Clean and reseed database
-        success = test_db_manager.clean_database()
+        success = test_database_setup.clean_database()
         assert success is True
         
-        success = test_db_manager.seed_test_data()
+        success = test_database_setup.seed_test_data()
         assert success is True
         
         # Verify data was reset to initial state
-        with get_db_session() as session:
-            session.execute("SELECT COUNT(*) as count FROM users")
-            final_users = session.fetchone()['count']
-            
-            session.execute("SELECT COUNT(*) as count FROM decks")
-            final_decks = session.fetchone()['count']
-            
-            # Should be back to initial test data counts
-            assert final_users == initial_users
-            assert final_decks == initial_decks
\ No newline at end of file
+        final = test_database_setup.execute_query(counts_query, fetchone=True)
+        
+        # Should be back to initial test data counts
+        assert final['users'] == initial['users']
+        assert final['decks'] == initial['decks']
@@ -4,15 +4,15 @@ Integration test runner for database operations
 """
 import sys
 import os
+import argparse
 import subprocess
-import time
 import logging
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from tests.fixtures.test_db_manager import test_db_manager
+from tests.fixtures.test_db_manager import TestDatabaseManager
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +21,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Database manager used by this runner; pytest builds its own per session
+test_db_manager = TestDatabaseManager()
+
 
 def check_docker_available():
     """Check if Docker is available and running"""
@@ -32,8 +35,24 @@ def check_docker_available():
         return False
 
 
-def start_test_database():
-    """Start test database container"""
+def test_database_container_healthy():
+    """Check whether the test database container is already running and healthy"""
+    try:
+        result = subprocess.run(
+            ['docker', 'inspect', '--format', '{{.State.Health.Status}}', 'clash-test-db'],
+            capture_output=True, text=True, timeout=10
+        )
+        return result.returncode == 0 and result.stdout.strip() == 'healthy'
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+
+
+def start_test_database(fresh=False):
+    """Start test database container, reusing a healthy one unless fresh is set"""
+    if not fresh and test_database_container_healthy():
+        logger.info("Reusing running test database container")
+        return True
+    
     logger.info("Starting test database container...")
     
     try:
@@ -66,14 +85,11 @@ def wait_for_database():
     """Wait for test database to be ready"""
     logger.info("Waiting for test database to be ready...")
     
-    max_attempts = 30
-    for attempt in range(max_attempts):
-        if test_db_manager.wait_for_database(timeout=5):
-            logger.info("Test database is ready!")
-            return True
-        
-        logger.info(f"Attempt {attempt + 1}/{max_attempts}: Database not ready yet...")
-        time.sleep(2)
+    # wait_for_database polls with exponential backoff, so one call covers
+    # both an already-running container and a cold start
+    if test_db_manager.wait_for_database(timeout=120):
+        logger.info("Test database is ready!")
+        return True
     
     logger.error("Test database failed to become ready")
     return False
@@ -95,7 +111,7 @@ def setup_test_database():
         return False
 
 
-def run_tests():
+def run_tests(verbose=False, parallel=False):
     """Run integration tests"""
     logger.info("Running integration tests...")
     
@@ -103,14 +119,22 @@ def run_tests():
         # Change to backend directory
         os.chdir(Path(__file__).parent.parent)
         
-        # Run pytest with integration tests
-        result = subprocess.run([
+        pytest_args = [
             'uv', 'run', 'pytest', 
             'tests/integration/', 
-            '-v', 
+            '-v' if verbose else '-q', 
             '--tb=short',
             '--durations=10'
-        ], timeout=300)
+        ]
+        
+        # Spread modules across pytest-xdist workers; each worker runs
+        # against its own full-schema copy of the test database, checked
+        # against the template's foreign keys when the session starts
+        if parallel:
+            pytest_args += ['-n', 'auto', '--dist=loadscope']
+        
+        # Run pytest with integration tests
+        result = subprocess.run(pytest_args, timeout=300)
         
         return result.returncode == 0
         
@@ -137,6 +161,18 @@ def cleanup_test_environment():
 
 def main():
     """Main test runner function"""
+    parser = argparse.ArgumentParser(description="Run backend integration tests")
+    parser.add_argument(
+        '--fresh', action='store_true',
+        help="Recreate the test database container before the run and remove it afterwards (for CI)"
+    )
+    parser.add_argument('--verbose', action='store_true', help="Report every test, not just failures")
+    parser.add_argument(
+        '--parallel', action='store_true',
+        help="Run test modules across pytest-xdist workers (pytest-xdist must be installed)"
+    )
+    args = parser.parse_args()
+    
     logger.info("Starting integration test runner...")
     
     # Check if Docker is available
@@ -146,7 +182,7 @@ def main():
     
     try:
         # Start test database
-        if not start_test_database():
+        if not start_test_database(fresh=args.fresh):
             return 1
         
         # Wait for database to be ready
@@ -158,7 +194,7 @@ def main():
             return 1
         
         # Run tests
-        if not run_tests():
+        if not run_tests(verbose=args.verbose, parallel=args.parallel):
             logger.error("Integration tests failed")
             return 1
         
@@ -172,7 +208,10 @@ def main():
         logger.error(f"Unexpected error: {e}")
         return 1
     finally:
-        cleanup_test_environment()
+        # Without --fresh the container is left running for the next run;
+        # setup_test_database reseeds it then
+        if args.fresh:
+            cleanup_test_environment()
 
 
 if __name__ == "__main__":
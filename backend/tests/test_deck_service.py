@@ -320,6 +320,8 @@ class TestDeckService:
         assert result[0].name == "Deck 1"
         assert result[1].name == "Deck 2"
         assert len(result[1].evolution_slots) == 1
+        # Cards and evolution slots come back with their deck row, no per-deck queries
+        deck_service.db_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_get_user_decks_empty(self, deck_service, sample_user):
@@ -337,3 +337,71 @@ async def test_get_card_by_id_database_error(mock_cache, card_service, mock_db_s
 
     assert "Failed to retrieve card" in str(exc_info.value)
     assert exc_info.value.original_error is not None
+
+
+@pytest.fixture
+def pooled_session(sample_card_rows):
+    """Patch get_db_session with a pooled session that records when it is released."""
+    events = []
+    session = MagicMock()
+    session.fetchall.return_value = sample_card_rows
+    session_cm = MagicMock()
+    session_cm.__enter__.return_value = session
+    session_cm.__exit__.side_effect = lambda *exc: events.append("released")
+    with patch('src.services.card_service.get_db_session', return_value=session_cm) as mock_get_session:
+        yield mock_get_session, session_cm, events
+
+
+@pytest.mark.asyncio
+@patch('src.services.card_service.cards_cache')
+async def test_get_all_cards_cache_hit_does_not_open_session(mock_cache, pooled_session):
+    """Test that a cache hit without an injected session never checks one out of the pool."""
+    # Arrange
+    mock_get_session, _, _ = pooled_session
+    cached_cards = [MagicMock(spec=Card)]
+    mock_cache.get.return_value = cached_cards
+
+    # Act
+    cards = await CardService().get_all_cards()
+
+    # Assert
+    assert cards is cached_cards
+    mock_get_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch('src.services.card_service.cards_cache')
+async def test_get_all_cards_cache_miss_releases_session_once(mock_cache, pooled_session):
+    """Test that a cache miss opens and releases one pooled session before caching the cards."""
+    # Arrange
+    mock_get_session, session_cm, events = pooled_session
+    mock_cache.get.return_value = None  # Cache miss
+    mock_cache.set.side_effect = lambda *args: events.append("cached")
+
+    # Act
+    cards = await CardService().get_all_cards()
+
+    # Assert
+    assert len(cards) == 3
+    mock_get_session.assert_called_once_with()
+    session_cm.__enter__.assert_called_once()
+    session_cm.__exit__.assert_called_once()
+    assert events == ["released", "cached"]
+
+
+@pytest.mark.asyncio
+@patch('src.services.card_service.cards_cache')
+async def test_get_all_cards_checkout_error(mock_cache, pooled_session):
+    """Test that failing to check a session out of the pool raises DatabaseError."""
+    # Arrange
+    _, session_cm, _ = pooled_session
+    mock_cache.get.return_value = None  # Cache miss
+    session_cm.__enter__.side_effect = MySQLError("Failed getting connection; pool exhausted")
+
+    # Act & Assert
+    with pytest.raises(DatabaseError) as exc_info:
+        await CardService().get_all_cards()
+
+    assert "Failed to retrieve cards from database" in str(exc_info.value)
+    assert isinstance(exc_info.value.original_error, MySQLError)
+    mock_cache.set.assert_not_called()
@@ -19,6 +19,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.scripts.ingest_cards import (
     determine_card_type,
     transform_card_data,
+    transform_cards,
     load_json_file
 )
 
@@ -248,6 +249,24 @@ class TestTransformCardData:
         assert result['type'] == 'Spell'
 
 
+class TestTransformCards:
+    """Tests for transform_cards() function."""
+    
+    def test_transform_cards_drops_invalid_and_keeps_order(self):
+        """Test that invalid cards are dropped and valid ones keep input order."""
+        cards_json = [
+            {'id': 28000001, 'name': 'Fireball', 'elixirCost': 4, 'rarity': 'rare',
+             'iconUrls': {'medium': 'https://example.com/fireball.png'}},
+            {'id': 26000001, 'name': 'No Image', 'elixirCost': 3, 'rarity': 'common'},
+            {'id': 27000000, 'name': 'Cannon', 'elixirCost': 3, 'rarity': 'common',
+             'iconUrls': {'medium': 'https://example.com/cannon.png'}},
+        ]
+        
+        result = transform_cards(cards_json)
+        assert [card['id'] for card in result] == [28000001, 27000000]
+        assert [card['type'] for card in result] == ['Spell', 'Building']
+
+
 class TestLoadJsonFile:
     """Tests for load_json_file() function."""
     
@@ -193,3 +193,14 @@ def test_deck_auto_calculate_average_elixir_on_init_provided():
     deck = Deck(name="Auto Elixir Deck", cards=cards, average_elixir=5.0)
     assert deck.average_elixir == 5.0 # Should respect provided value if not None
 
+
+def test_deck_auto_calculate_average_elixir_exceeds_limit():
+    card1 = Card(**{**sample_card_data, "elixir_cost": 10})
+    cards = [card1] * 8
+    # (8*10 + 2*10) / 8 = 12.5, reported against the field's own le=10 bound
+    with pytest.raises(ValidationError) as exc_info:
+        Deck(name="Heavy Evo Deck", cards=cards, evolution_slots=[card1, card1])
+    error, = exc_info.value.errors()
+    assert error["loc"] == ("average_elixir",)
+    assert error["type"] == "less_than_equal"
+    assert error["input"] == 12.5